@@ -6,6 +6,10 @@ Ce module parcourt l'AST validé et produit du code Python
 équivalent au pseudocode source.
 """
 
+import io
+import sys
+from operator import attrgetter
+
 from parser import (
     ASTNode, ProgramNode, DeclarationNode, AssignmentNode,
     NumberNode, StringNode, BooleanNode, VariableNode,
@@ -16,6 +20,72 @@ from parser import (
 )
 
 
+# Mapping des opérateurs pseudocode vers Python
+_BINOP_MAP = {
+    '=': '==',      # Égalité
+    '≠': '!=',      # Différent
+    'ET': 'and',    # ET logique
+    'OU': 'or',     # OU logique
+    '+': '+',
+    '-': '-',
+    '*': '*',
+    '/': '/',
+    '<': '<',
+    '>': '>',
+    '<=': '<=',
+    '>=': '>='
+}
+_BINOP_MAP = {op: sys.intern(py_op) for op, py_op in _BINOP_MAP.items()}
+
+# Précédence des opérateurs Python (plus grand = plus prioritaire),
+# utilisée pour n'émettre que les parenthèses nécessaires
+_PRECEDENCE = {
+    'or': 1,
+    'and': 2,
+    'not': 3,
+    '==': 4, '!=': 4, '<': 4, '>': 4, '<=': 4, '>=': 4,
+    '+': 5, '-': 5,
+    '*': 6, '/': 6,
+}
+_COMPARISON_PREC = 4  # Les comparaisons Python s'enchaînent: a < b < c
+_UNARY_MINUS_PREC = 7
+_ATOM_PREC = 8  # Littéraux, variables, appels, accès tableau
+
+# Fragments de code fixes réutilisés à chaque émission
+_RETURN = sys.intern("return ")
+_PRINT = sys.intern("print(")
+_ELSE = sys.intern("else:")
+_IF = sys.intern("if ")
+_WHILE = sys.intern("while ")
+_EQ = sys.intern(" = ")
+_EMPTY_STRING = sys.intern('""')
+
+# Valeurs initiales des variables selon leur type
+_INIT_VALUES = {
+    'ENTIER': '0',
+    'REEL': '0.0',
+    'CHAINE': '""',
+    'BOOLEEN': 'False'
+}
+
+# Types acceptés dans une fonction compilée avec Numba (@njit)
+_NUMERIC_TYPES = {'ENTIER', 'REEL'}
+
+# Sous-expressions de chaque noeud composé, dans l'ordre d'évaluation
+# (parcours itératif de _generate_expression)
+_EXPR_CHILDREN = {
+    BinaryOpNode: attrgetter('left', 'right'),
+    UnaryOpNode: lambda node: (node.operand,),
+    FunctionCallNode: attrgetter('arguments'),
+    ArrayAccessNode: lambda node: (node.index,),
+}
+
+# Lecture groupée des attributs des instructions (un seul appel C)
+_ARRAY_ASSIGN_FIELDS = attrgetter('array_name', 'index', 'value')
+_IF_FIELDS = attrgetter('condition', 'then_branch', 'else_branch')
+_FOR_FIELDS = attrgetter('variable', 'start', 'end', 'body')
+
+
 class CodeGenerator:
     """
     Générateur de code Python à partir de l'AST.
@@ -24,18 +94,79 @@ class CodeGenerator:
     avec une gestion correcte de l'indentation.
     """
     
-    def __init__(self):
-        """Initialise le générateur de code."""
-        self.code = []  # Liste des lignes de code
+    # Chaînes d'indentation précalculées, indexées par niveau
+    # (étendues à la demande pour les imbrications profondes)
+    _INDENTS = ["", "    ", "        ", "            ", "                "]
+    
+    def __init__(self, enable_numba=False):
+        """
+        Initialise le générateur de code.
+        
+        Args:
+            enable_numba: Si True, les fonctions purement numériques sont
+                décorées avec @njit (nécessite numba à l'exécution)
+        """
+        self.enable_numba = enable_numba
+        self._numba_functions = set()  # Fonctions à décorer avec @njit
+        self._out = None  # Flux de sortie du code généré (voir generate_to)
+        self._write = None  # Méthode write du flux, liée une fois pour toutes
         self.indent_level = 0  # Niveau d'indentation actuel
+        self._indent_str = ""  # Indentation correspondant à indent_level
+        self._pending_blank = False  # Ligne vide à émettre avant la prochaine ligne
+        
+        # Tables de dispatch: type de noeud → méthode de génération
+        self._stmt_dispatch = {
+            AssignmentNode: self._generate_assignment,
+            PrintNode: self._generate_print,
+            ReadNode: self._generate_read,
+            IfNode: self._generate_if,
+            WhileNode: self._generate_while,
+            ForNode: self._generate_for,
+            ReturnNode: self._generate_return,
+            FunctionCallNode: self._generate_function_call_statement,
+            ArrayAssignmentNode: self._generate_array_assignment,
+        }
+        self._expr_dispatch = {  # Feuilles
+            NumberNode: self._generate_number,
+            StringNode: self._generate_string,
+            BooleanNode: self._generate_boolean,
+            VariableNode: self._generate_variable,
+        }
+        self._expr_combine = {  # Noeuds composés: (noeud, sous-expressions)
+            BinaryOpNode: self._generate_binary_op,
+            UnaryOpNode: self._generate_unary_op,
+            FunctionCallNode: self._generate_function_call,
+            ArrayAccessNode: self._generate_array_access,
+        }
     
     def indent(self):
         """Retourne l'indentation actuelle (4 espaces par niveau)."""
-        return "    " * self.indent_level
+        return self._indent_str
+    
+    def _push_indent(self):
+        """Augmente le niveau d'indentation d'un cran."""
+        self.indent_level += 1
+        if self.indent_level >= len(self._INDENTS):
+            self._INDENTS.append("    " * self.indent_level)
+        self._indent_str = self._INDENTS[self.indent_level]
+    
+    def _pop_indent(self):
+        """Diminue le niveau d'indentation d'un cran."""
+        self.indent_level -= 1
+        self._indent_str = self._INDENTS[self.indent_level]
     
     def add_line(self, line):
         """Ajoute une ligne de code avec l'indentation actuelle."""
-        self.code.append(f"{self.indent()}{line}")
+        # Ligne vide demandée auparavant: émise seulement avant une vraie ligne
+        if self._pending_blank:
+            self._pending_blank = False
+            self._write("\n")
+        
+        # Cas le plus fréquent: niveau 0, aucune indentation à ajouter
+        if self.indent_level:
+            self._write(self._indent_str + line + "\n")
+        else:
+            self._write(line + "\n")
     
     def generate(self, node):
         """
@@ -47,42 +178,87 @@ class CodeGenerator:
         Returns:
             String contenant le code Python généré
         """
-        if isinstance(node, ProgramNode):
-            return self._generate_program(node)
-        else:
+        buf = io.StringIO()
+        self.generate_to(buf, node)
+        return buf.getvalue()
+    
+    def generate_code_object(self, node):
+        """
+        Génère le programme et le compile en objet code Python.
+        
+        L'objet code peut être exécuté plusieurs fois avec exec() sans
+        recompiler le texte source à chaque exécution.
+        
+        Args:
+            node: Le noeud AST racine (normalement un ProgramNode)
+            
+        Returns:
+            Objet code prêt pour exec()
+        """
+        source = self.generate(node)
+        return compile(source, f"<{node.name}>", "exec")
+    
+    def generate_to(self, stream, node):
+        """
+        Génère le code Python directement dans un flux.
+        
+        Le code est écrit au fur et à mesure de la génération, sans être
+        accumulé en mémoire (utile pour écrire directement dans un fichier).
+        
+        Args:
+            stream: Objet fichier texte ouvert en écriture (méthode write)
+            node: Le noeud AST racine (normalement un ProgramNode)
+        """
+        if not isinstance(node, ProgramNode):
             raise Exception(f"Attendu ProgramNode, reçu {type(node)}")
+        
+        self._out = stream
+        self._write = stream.write
+        self._pending_blank = False
+        try:
+            self._generate_program(node)
+        finally:
+            self._out = None
+            self._write = None
     
     def _generate_program(self, node):
         """Génère le code pour un programme complet."""
         # En-tête avec commentaire
-        self.code.append(f"# Programme généré à partir de: {node.name}")
-        self.code.append(f"# Compilateur Pseudocode → Python")
-        self.code.append("")
+        self.add_line("# Programme généré à partir de: " + node.name)
+        self.add_line("# Compilateur Pseudocode → Python")
+        self._pending_blank = True
+        
+        # Fonctions compilables avec Numba
+        if self.enable_numba:
+            self._numba_functions = {
+                func.name for func in node.functions
+                if self._is_numeric_function(func)
+            }
+            if self._numba_functions:
+                self.add_line("from numba import njit")
+                self._pending_blank = True
         
         # Générer les fonctions en premier
         if node.functions:
-            self.code.append("# Définitions des fonctions")
+            self.add_line("# Définitions des fonctions")
             for func in node.functions:
                 self._generate_function(func)
-            self.code.append("")
+            self._pending_blank = True
         
         # Générer les déclarations (initialisation des variables)
         if node.declarations:
-            self.code.append("# Déclarations des variables")
+            self.add_line("# Déclarations des variables")
             for decl in node.declarations:
-                if isinstance(decl, ArrayDeclarationNode):
+                if type(decl) is ArrayDeclarationNode:
                     self._generate_array_declaration(decl)
                 else:
                     self._generate_declaration(decl)
-            self.code.append("")
+            self._pending_blank = True
         
         # Générer les instructions
         if node.statements:
-            self.code.append("# Instructions")
-            for stmt in node.statements:
-                self._generate_statement(stmt)
-        
-        return "\n".join(self.code)
+            self.add_line("# Instructions")
+            self._generate_block(node.statements)
     
     def _generate_declaration(self, node):
         """
@@ -93,15 +269,8 @@ class CodeGenerator:
         VAR msg : CHAINE → msg = ""
         VAR flag : BOOLEEN → flag = False
         """
-        init_values = {
-            'ENTIER': '0',
-            'REEL': '0.0',
-            'CHAINE': '""',
-            'BOOLEEN': 'False'
-        }
-        
-        init_value = init_values.get(node.var_type, 'None')
-        self.add_line(f"{node.variable} = {init_value}  # {node.var_type}")
+        init_value = _INIT_VALUES.get(node.var_type, 'None')
+        self.add_line(node.variable + _EQ + init_value + "  # " + node.var_type)
     
     def _generate_array_declaration(self, node):
         """
@@ -109,16 +278,11 @@ class CodeGenerator:
         
         VAR tab : TABLEAU[10] DE ENTIER → tab = [0] * 10
         """
-        init_values = {
-            'ENTIER': '0',
-            'REEL': '0.0',
-            'CHAINE': '""',
-            'BOOLEEN': 'False'
-        }
-        
-        init_value = init_values.get(node.element_type, 'None')
-        size_code = self._generate_expression(node.size)
-        self.add_line(f"{node.variable} = [{init_value}] * {size_code}  # TABLEAU DE {node.element_type}")
+        init_value = _INIT_VALUES.get(node.element_type, 'None')
+        # La taille est l'opérande droit de "*": parenthésée si nécessaire
+        size_code = self._generate_expression(node.size, _PRECEDENCE['*'] + 1)
+        self.add_line(node.variable + " = [" + init_value + "] * " + size_code
+                      + "  # TABLEAU DE " + node.element_type)
     
     def _generate_function(self, node):
         """
@@ -127,53 +291,136 @@ class CodeGenerator:
         FONCTION carre(x: ENTIER) : ENTIER → def carre(x):
         """
         # Paramètres
-        params = ", ".join([p[0] for p in node.parameters])
-        self.add_line(f"def {node.name}({params}):")
+        parameters = node.parameters
+        if not parameters:
+            params = ""
+        elif len(parameters) == 1:
+            params = parameters[0][0]
+        else:
+            params = ", ".join([p[0] for p in parameters])
+        if node.name in self._numba_functions:
+            self.add_line("@njit")
+        self.add_line("def " + node.name + "(" + params + "):")
         
-        self.indent_level += 1
+        self._push_indent()
         
         # Déclarations locales
         for decl in node.declarations:
             self._generate_declaration(decl)
         
         # Corps de la fonction
-        for stmt in node.body:
-            self._generate_statement(stmt)
+        self._generate_block(node.body)
         
-        self.indent_level -= 1
-        self.code.append("")  # Ligne vide après la fonction
+        self._pop_indent()
+        self._pending_blank = True  # Ligne vide après la fonction
     
-    def _generate_statement(self, node):
-        """Génère le code pour une instruction."""
-        if isinstance(node, AssignmentNode):
-            self._generate_assignment(node)
-        
-        elif isinstance(node, PrintNode):
-            self._generate_print(node)
-        
-        elif isinstance(node, ReadNode):
-            self._generate_read(node)
-        
-        elif isinstance(node, IfNode):
-            self._generate_if(node)
-        
-        elif isinstance(node, WhileNode):
-            self._generate_while(node)
-        
-        elif isinstance(node, ForNode):
-            self._generate_for(node)
-        
-        elif isinstance(node, ReturnNode):
-            self._generate_return(node)
+    def _is_numeric_function(self, node):
+        """
+        Vérifie si une fonction peut être compilée avec Numba (@njit).
         
-        elif isinstance(node, FunctionCallNode):
-            self._generate_function_call_statement(node)
+        La fonction doit avoir uniquement des paramètres, variables locales
+        et un type de retour ENTIER ou REEL, et son corps ne doit contenir
+        ni entrée/sortie, ni chaîne, ni tableau, ni appel de fonction, ni
+        référence à une variable globale (Numba la figerait à la compilation).
+        """
+        if node.return_type not in _NUMERIC_TYPES:
+            return False
+        
+        local_names = set()
+        for param_name, param_type in node.parameters:
+            if param_type not in _NUMERIC_TYPES:
+                return False
+            local_names.add(param_name)
+        for decl in node.declarations:
+            if type(decl) is not DeclarationNode or decl.var_type not in _NUMERIC_TYPES:
+                return False
+            local_names.add(decl.variable)
+        
+        work = list(node.body)
+        while work:
+            item = work.pop()
+            item_type = type(item)
+            
+            if item_type is AssignmentNode:
+                if item.target not in local_names:
+                    return False
+                work.append(item.value)
+            elif item_type is ReturnNode:
+                if item.value is None:
+                    return False
+                work.append(item.value)
+            elif item_type is IfNode:
+                work.append(item.condition)
+                work.extend(item.then_branch)
+                if item.else_branch:
+                    work.extend(item.else_branch)
+            elif item_type is WhileNode:
+                work.append(item.condition)
+                work.extend(item.body)
+            elif item_type is ForNode:
+                if item.variable not in local_names:
+                    return False
+                work.extend((item.start, item.end))
+                work.extend(item.body)
+            elif item_type is BinaryOpNode:
+                work.extend((item.left, item.right))
+            elif item_type is UnaryOpNode:
+                work.append(item.operand)
+            elif item_type is VariableNode:
+                if item.name not in local_names:
+                    return False
+            elif item_type is not NumberNode and item_type is not BooleanNode:
+                return False
+        
+        return True
+    
+    def _generate_block(self, statements):
+        """
+        Génère une suite d'instructions au niveau d'indentation courant.
         
-        elif isinstance(node, ArrayAssignmentNode):
-            self._generate_array_assignment(node)
+        Les instructions simples (affectation ou RETOURNER d'une variable
+        ou d'un nombre) sont écrites directement, sans passer par la
+        table de dispatch ni par _generate_expression.
+        """
+        write = self._write
+        indent = self._indent_str
         
-        else:
+        for stmt in statements:
+            stmt_type = type(stmt)
+            line = None
+            
+            if stmt_type is AssignmentNode:
+                value = stmt.value
+                value_type = type(value)
+                if value_type is VariableNode:
+                    line = stmt.target + _EQ + value.name
+                elif value_type is NumberNode:
+                    line = stmt.target + _EQ + str(value.value)
+            
+            elif stmt_type is ReturnNode:
+                value = stmt.value
+                value_type = type(value)
+                if value_type is VariableNode:
+                    line = _RETURN + value.name
+                elif value_type is NumberNode:
+                    line = _RETURN + str(value.value)
+            
+            if line is None:
+                self._generate_statement(stmt)
+                continue
+            
+            # Comme add_line: une ligne vide en attente précède la ligne
+            if self._pending_blank:
+                self._pending_blank = False
+                write("\n")
+            write(indent + line + "\n")
+    
+    def _generate_statement(self, node):
+        """Génère le code pour une instruction."""
+        handler = self._stmt_dispatch.get(type(node))
+        if handler is None:
             raise Exception(f"Type d'instruction inconnu: {type(node)}")
+        handler(node)
     
     def _generate_return(self, node):
         """
@@ -182,7 +429,7 @@ class CodeGenerator:
         RETOURNER x * x → return x * x
         """
         value_code = self._generate_expression(node.value)
-        self.add_line(f"return {value_code}")
+        self.add_line(_RETURN + value_code)
     
     def _generate_array_assignment(self, node):
         """
@@ -190,14 +437,21 @@ class CodeGenerator:
         
         tab[i] ← 10 → tab[i] = 10
         """
-        index_code = self._generate_expression(node.index)
-        value_code = self._generate_expression(node.value)
-        self.add_line(f"{node.array_name}[{index_code}] = {value_code}")
+        array_name, index, value = _ARRAY_ASSIGN_FIELDS(node)
+        index_code = self._generate_expression(index)
+        value_code = self._generate_expression(value)
+        self.add_line(array_name + "[" + index_code + "] = " + value_code)
     
     def _generate_function_call_statement(self, node):
         """Génère le code pour un appel de fonction comme instruction."""
-        args = ", ".join([self._generate_expression(arg) for arg in node.arguments])
-        self.add_line(f"{node.name}({args})")
+        arguments = node.arguments
+        if not arguments:
+            args = ""
+        elif len(arguments) == 1:
+            args = self._generate_expression(arguments[0])
+        else:
+            args = ", ".join([self._generate_expression(arg) for arg in arguments])
+        self.add_line(node.name + "(" + args + ")")
     
     def _generate_assignment(self, node):
         """
@@ -206,7 +460,7 @@ class CodeGenerator:
         x ← 10 → x = 10
         """
         value_code = self._generate_expression(node.value)
-        self.add_line(f"{node.target} = {value_code}")
+        self.add_line(node.target + _EQ + value_code)
     
     def _generate_print(self, node):
         """
@@ -215,8 +469,12 @@ class CodeGenerator:
         ECRIRE(x) → print(x)
         ECRIRE("Hello", x) → print("Hello", x)
         """
-        expressions = [self._generate_expression(expr) for expr in node.expressions]
-        self.add_line(f"print({', '.join(expressions)})")
+        expressions = node.expressions
+        if len(expressions) == 1:
+            args = self._generate_expression(expressions[0])
+        else:
+            args = ", ".join([self._generate_expression(expr) for expr in expressions])
+        self.add_line(_PRINT + args + ")")
     
     def _generate_read(self, node):
         """
@@ -229,7 +487,7 @@ class CodeGenerator:
         """
         # Par simplicité, on suppose que c'est toujours un entier
         # Une amélioration serait de passer la table des symboles
-        self.add_line(f"{node.variable} = int(input())")
+        self.add_line(node.variable + " = int(input())")
     
     def _generate_if(self, node):
         """
@@ -241,22 +499,21 @@ class CodeGenerator:
             ECRIRE("petit")   →      print("petit")
         FIN_SI                →
         """
-        condition_code = self._generate_expression(node.condition)
-        self.add_line(f"if {condition_code}:")
+        condition, then_branch, else_branch = _IF_FIELDS(node)
+        condition_code = self._generate_expression(condition)
+        self.add_line(_IF + condition_code + ":")
         
         # Bloc ALORS
-        self.indent_level += 1
-        for stmt in node.then_branch:
-            self._generate_statement(stmt)
-        self.indent_level -= 1
+        self._push_indent()
+        self._generate_block(then_branch)
+        self._pop_indent()
         
         # Bloc SINON (si présent)
-        if node.else_branch:
-            self.add_line("else:")
-            self.indent_level += 1
-            for stmt in node.else_branch:
-                self._generate_statement(stmt)
-            self.indent_level -= 1
+        if else_branch:
+            self.add_line(_ELSE)
+            self._push_indent()
+            self._generate_block(else_branch)
+            self._pop_indent()
     
     def _generate_while(self, node):
         """
@@ -268,12 +525,11 @@ class CodeGenerator:
         FIN_TANT_QUE           →
         """
         condition_code = self._generate_expression(node.condition)
-        self.add_line(f"while {condition_code}:")
+        self.add_line(_WHILE + condition_code + ":")
         
-        self.indent_level += 1
-        for stmt in node.body:
-            self._generate_statement(stmt)
-        self.indent_level -= 1
+        self._push_indent()
+        self._generate_block(node.body)
+        self._pop_indent()
     
     def _generate_for(self, node):
         """
@@ -283,56 +539,116 @@ class CodeGenerator:
             ECRIRE(i)           →      print(i)
         FIN_POUR                →
         """
-        start_code = self._generate_expression(node.start)
-        end_code = self._generate_expression(node.end)
+        variable, start, end, body = _FOR_FIELDS(node)
+        start_code = self._generate_expression(start)
+        end_code = self._generate_expression(end, _PRECEDENCE['+'])
         
         # En Python, range() exclut la borne supérieure, donc on ajoute 1
-        self.add_line(f"for {node.variable} in range({start_code}, {end_code} + 1):")
+        self.add_line("for " + variable + " in range(" + start_code + ", " + end_code + " + 1):")
         
-        self.indent_level += 1
-        for stmt in node.body:
-            self._generate_statement(stmt)
-        self.indent_level -= 1
+        self._push_indent()
+        self._generate_block(body)
+        self._pop_indent()
     
-    def _generate_expression(self, node):
+    def _generate_expression(self, node, parent_prec=0):
         """
         Génère le code pour une expression.
         
+        Le parcours est itératif (post-ordre avec une pile explicite)
+        pour éviter un appel récursif par noeud: les sous-expressions
+        sont générées d'abord, puis combinées par le noeud parent.
+        
+        Args:
+            node: Le noeud de l'expression
+            parent_prec: Précédence du contexte; l'expression est mise
+                entre parenthèses si elle est moins prioritaire
+        
         Returns:
             String contenant l'expression Python
         """
-        if isinstance(node, NumberNode):
-            return str(node.value)
-        
-        elif isinstance(node, StringNode):
-            # Échapper les guillemets dans la chaîne
-            escaped = node.value.replace('"', '\\"')
-            return f'"{escaped}"'
-        
-        elif isinstance(node, BooleanNode):
-            return "True" if node.value else "False"
-        
-        elif isinstance(node, VariableNode):
-            return node.name
-        
-        elif isinstance(node, BinaryOpNode):
-            return self._generate_binary_op(node)
-        
-        elif isinstance(node, UnaryOpNode):
-            return self._generate_unary_op(node)
-        
-        elif isinstance(node, FunctionCallNode):
-            args = ", ".join([self._generate_expression(arg) for arg in node.arguments])
-            return f"{node.name}({args})"
-        
-        elif isinstance(node, ArrayAccessNode):
-            index_code = self._generate_expression(node.index)
-            return f"{node.array_name}[{index_code}]"
+        work = [(node, None)]  # (noeud, nombre de sous-expressions prêtes)
+        results = []  # Pile des (code, précédence) déjà générés
         
+        while work:
+            node, count = work.pop()
+            node_type = type(node)
+            
+            # Second passage: les sous-expressions sont sur la pile
+            if count is not None:
+                if count:
+                    parts = results[-count:]
+                    del results[-count:]
+                else:
+                    parts = []
+                results.append(self._expr_combine[node_type](node, parts))
+                continue
+            
+            # Feuilles les plus fréquentes: traitées sans passer par la table
+            if node_type is VariableNode:
+                results.append((node.name, _ATOM_PREC))
+                continue
+            if node_type is NumberNode:
+                results.append((str(node.value), _ATOM_PREC))
+                continue
+            
+            # Autres feuilles: générées immédiatement
+            leaf = self._expr_dispatch.get(node_type)
+            if leaf is not None:
+                results.append((leaf(node), _ATOM_PREC))
+                continue
+            
+            # Noeud composé: planifier ses sous-expressions
+            children = _EXPR_CHILDREN.get(node_type)
+            if children is None:
+                raise Exception(f"Type d'expression inconnu: {node_type}")
+            children = children(node)
+            work.append((node, len(children)))
+            for child in reversed(children):
+                work.append((child, None))
+        
+        code, prec = results[0]
+        if prec < parent_prec:
+            return "(" + code + ")"
+        return code
+    
+    def _generate_number(self, node):
+        """Génère le code pour un nombre littéral."""
+        return str(node.value)
+    
+    def _generate_string(self, node):
+        """Génère le code pour une chaîne littérale."""
+        value = node.value
+        if not value:
+            return _EMPTY_STRING
+        # Échapper les guillemets dans la chaîne (seulement s'il y en a)
+        if '"' in value:
+            value = value.replace('"', '\\"')
+        return '"' + value + '"'
+    
+    def _generate_boolean(self, node):
+        """Génère le code pour un booléen littéral."""
+        return "True" if node.value else "False"
+    
+    def _generate_variable(self, node):
+        """Génère le code pour une référence à une variable."""
+        return node.name
+    
+    def _generate_function_call(self, node, parts):
+        """Génère le code pour un appel de fonction dans une expression."""
+        if not parts:
+            args = ""
+        elif len(parts) == 1:
+            args = parts[0][0]
         else:
-            raise Exception(f"Type d'expression inconnu: {type(node)}")
+            args = ", ".join([code for code, _ in parts])
+        return node.name + "(" + args + ")", _ATOM_PREC
     
-    def _generate_binary_op(self, node):
+    def _generate_array_access(self, node, parts):
+        """Génère le code pour un accès à un élément de tableau."""
+        (index_code, _), = parts
+        return node.array_name + "[" + index_code + "]", _ATOM_PREC
+    
+    def _generate_binary_op(self, node, parts):
         """
         Génère le code pour une opération binaire.
         
@@ -341,43 +657,43 @@ class CodeGenerator:
         - ≠ → !=
         - ET → and
         - OU → or
-        """
-        left = self._generate_expression(node.left)
-        right = self._generate_expression(node.right)
-        
-        # Mapping des opérateurs pseudocode vers Python
-        op_mapping = {
-            '=': '==',      # Égalité
-            '≠': '!=',      # Différent
-            'ET': 'and',    # ET logique
-            'OU': 'or',     # OU logique
-            '+': '+',
-            '-': '-',
-            '*': '*',
-            '/': '/',
-            '<': '<',
-            '>': '>',
-            '<=': '<=',
-            '>=': '>='
-        }
         
-        python_op = op_mapping.get(node.operator, node.operator)
-        
-        return f"({left} {python_op} {right})"
+        Les opérandes ne sont parenthésés que si leur précédence
+        l'exige: a + b * c, mais (a + b) * c et a - (b - c).
+        Les comparaisons imbriquées sont toujours parenthésées car
+        Python les enchaînerait (a < b < c).
+        """
+        (left, left_prec), (right, right_prec) = parts
+        python_op = _BINOP_MAP.get(node.operator, node.operator)
+        prec = _PRECEDENCE.get(python_op, 0)
+        
+        # Associativité à gauche: seul l'opérande droit de même
+        # précédence a besoin de parenthèses
+        if left_prec < prec or (left_prec == prec == _COMPARISON_PREC):
+            left = "(" + left + ")"
+        if right_prec <= prec:
+            right = "(" + right + ")"
+        
+        return left + " " + python_op + " " + right, prec
     
-    def _generate_unary_op(self, node):
+    def _generate_unary_op(self, node, parts):
         """
         Génère le code pour une opération unaire.
         
         - NON x → not x
         - -x → -x
         """
-        operand = self._generate_expression(node.operand)
+        (operand, operand_prec), = parts
         
         if node.operator == 'NON':
-            return f"(not {operand})"
-        else:
-            return f"({node.operator}{operand})"
+            prec = _PRECEDENCE['not']
+            if operand_prec < prec:
+                operand = "(" + operand + ")"
+            return "not " + operand, prec
+        
+        if operand_prec < _UNARY_MINUS_PREC:
+            operand = "(" + operand + ")"
+        return node.operator + operand, _UNARY_MINUS_PREC
 
 
 # ============================================================
@@ -385,9 +701,7 @@ class CodeGenerator:
 # ============================================================
 
 if __name__ == '__main__':
-    import sys
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
     
     from lexer import Lexer
     from parser import Parser
@@ -6,6 +6,74 @@ Ce module lit le pseudocode caractère par caractère et produit
 une liste de tokens qui seront utilisés par le parser.
 """
 
+import re
+import sys
+from bisect import bisect_right
+from collections import deque
+
+
+# Lexèmes reconnus d'un seul coup par le moteur d'expressions régulières
+# (automate en C) plutôt que caractère par caractère en Python
+_NUMBER_RE = re.compile(r'\d+(\.\d+)?')
+_IDENTIFIER_RE = re.compile(r'\w+')
+_NEWLINE_RE = re.compile('\n')
+
+# Classes de caractères (bits) pour la boucle principale de tokenize
+_WHITESPACE = 1
+_DIGIT = 2
+_IDSTART = 4  # Début d'identificateur: lettre ou _
+_QUOTE = 8
+
+# Caractères d'espacement ignorés entre les tokens
+_WS_SET = frozenset(' \t\n\r')
+
+
+def _classify(char):
+    """Retourne les bits de classe d'un caractère."""
+    if char in _WS_SET:
+        return _WHITESPACE
+    if char.isdigit():
+        return _DIGIT
+    if char.isalpha() or char == '_':
+        return _IDSTART
+    if char in '"\'':
+        return _QUOTE
+    return 0
+
+
+# Valeurs d'opérateurs qui ne sont pas des noms (donc pas internalisées
+# automatiquement par CPython): un seul objet chaîne par opérateur, partagé
+# par tous les tokens et retrouvé par identité dans les tables du parser
+_ASSIGN = sys.intern('←')
+_NOT_EQUAL = sys.intern('≠')
+_LESS_EQUAL = sys.intern('<=')
+_GREATER_EQUAL = sys.intern('>=')
+
+# Ponctuation et opérateurs d'un seul caractère → (type de token, valeur);
+# '/', '<' et '>' peuvent commencer un lexème de deux caractères et sont
+# traités à part dans tokenize
+_PUNCT = {
+    '(': ('LPAREN', '('),
+    ')': ('RPAREN', ')'),
+    ':': ('COLON', ':'),
+    ',': ('COMMA', ','),
+    '+': ('OPERATOR', '+'),
+    '*': ('OPERATOR', '*'),
+    '-': ('OPERATOR', '-'),
+    '=': ('OPERATOR', '='),
+    '[': ('LBRACKET', '['),
+    ']': ('RBRACKET', ']'),
+    _ASSIGN: ('ASSIGN', _ASSIGN),
+    _NOT_EQUAL: ('OPERATOR', _NOT_EQUAL),
+}
+
+
+# Table des classes pour le Latin-1 (ASCII et lettres accentuées du
+# français): un seul accès indexé par caractère; les autres caractères
+# (←, ≠, ...) passent par _classify
+_CHAR_CLASS_SIZE = 256
+_CHAR_CLASS = bytes(_classify(chr(code)) for code in range(_CHAR_CLASS_SIZE))
+
 
 class Token:
     """
@@ -17,6 +85,9 @@ class Token:
         line: Le numéro de ligne pour les messages d'erreur
     """
     
+    # Pas de __dict__ par token: moins de mémoire, accès aux attributs plus rapide
+    __slots__ = ('type', 'value', 'line')
+    
     def __init__(self, type, value, line=1):
         self.type = type
         self.value = value
@@ -49,7 +120,7 @@ class Lexer:
     """
     
     # Mots-clés du langage pseudocode
-    KEYWORDS = {
+    KEYWORDS = frozenset({
         'ALGORITHME', 'VAR', 'DEBUT', 'FIN',
         'SI', 'ALORS', 'SINON', 'FIN_SI',
         'TANT_QUE', 'FAIRE', 'FIN_TANT_QUE',
@@ -59,10 +130,15 @@ class Lexer:
         'VRAI', 'FAUX',
         'FONCTION', 'FIN_FONCTION', 'RETOURNER',
         'TABLEAU'
-    }
+    })
     
     # Types de données
-    TYPES = {'ENTIER', 'REEL', 'CHAINE', 'BOOLEEN', 'VOID'}
+    TYPES = frozenset({'ENTIER', 'REEL', 'CHAINE', 'BOOLEEN', 'VOID'})
+    
+    # Mots réservés → (type de token, valeur) en une seule table;
+    # la valeur est la chaîne littérale ci-dessus, partagée par tous les tokens
+    RESERVED = {word: ('KEYWORD', word) for word in KEYWORDS}
+    RESERVED.update({word: ('TYPE', word) for word in TYPES})
     
     def __init__(self, text):
         """
@@ -72,38 +148,48 @@ class Lexer:
             text: Le code source pseudocode à analyser
         """
         self.text = text
+        self.length = len(text)  # Longueur du texte, calculée une seule fois
         self.pos = 0  # Position actuelle dans le texte
-        self.line = 1  # Numéro de ligne actuel
         self.current_char = self.text[0] if text else None
+        # Mots déjà classés → (type de token, valeur), amorcé avec les mots
+        # réservés: chaque occurrence suivante ne coûte qu'un accès
+        self._words = dict(self.RESERVED)
+        # Positions des retours à la ligne, pour retrouver la ligne d'une
+        # position sans compter les '\n' à chaque caractère (relevées en une
+        # passe par le moteur d'expressions régulières); comme l'ancien
+        # compteur, un '\n' en tout début de texte n'est pas compté
+        self._newlines = [match.start() for match in _NEWLINE_RE.finditer(text, 1)]
+    
+    def line_at(self, pos):
+        """Retourne le numéro de ligne de la position donnée."""
+        return bisect_right(self._newlines, pos) + 1
+    
+    @property
+    def line(self):
+        """Numéro de ligne de la position actuelle."""
+        return self.line_at(self.pos)
     
     def advance(self):
         """Avance au caractère suivant."""
         self.pos += 1
-        if self.pos < len(self.text):
-            self.current_char = self.text[self.pos]
-            if self.current_char == '\n':
-                self.line += 1
-        else:
-            self.current_char = None
+        self.current_char = self.text[self.pos] if self.pos < self.length else None
+    
+    def jump_to(self, pos):
+        """Avance directement à la position donnée."""
+        self.pos = pos
+        self.current_char = self.text[pos] if pos < self.length else None
     
     def peek(self):
         """Regarde le caractère suivant sans avancer."""
         peek_pos = self.pos + 1
-        if peek_pos < len(self.text):
+        if peek_pos < self.length:
             return self.text[peek_pos]
         return None
     
-    def skip_whitespace(self):
-        """Ignore les espaces et tabulations (mais compte les nouvelles lignes)."""
-        while self.current_char is not None and self.current_char in ' \t\n\r':
-            if self.current_char == '\n':
-                pass  # La ligne est déjà incrémentée dans advance()
-            self.advance()
-    
     def skip_comment(self):
         """Ignore les commentaires // jusqu'à la fin de ligne."""
-        while self.current_char is not None and self.current_char != '\n':
-            self.advance()
+        end = self.text.find('\n', self.pos)
+        self.jump_to(end if end != -1 else self.length)
     
     def read_number(self):
         """
@@ -112,21 +198,16 @@ class Lexer:
         Returns:
             Token de type NUMBER avec la valeur numérique
         """
-        result = ''
-        start_line = self.line
+        match = _NUMBER_RE.match(self.text, self.pos)
+        if match is None:
+            raise LexerError(f"Caractère invalide '{self.current_char}'", self.line)
         
-        # Partie entière
-        while self.current_char is not None and self.current_char.isdigit():
-            result += self.current_char
-            self.advance()
+        start_line = self.line
+        result = match.group()
+        self.jump_to(match.end())
         
         # Partie décimale (pour les réels)
-        if self.current_char == '.' and self.peek() and self.peek().isdigit():
-            result += self.current_char
-            self.advance()
-            while self.current_char is not None and self.current_char.isdigit():
-                result += self.current_char
-                self.advance()
+        if match.group(1):
             return Token('REAL_NUMBER', float(result), start_line)
         
         return Token('NUMBER', int(result), start_line)
@@ -140,19 +221,16 @@ class Lexer:
         """
         start_line = self.line
         quote_char = self.current_char  # " ou '
-        self.advance()  # Passer le guillemet ouvrant
-        
-        result = ''
-        while self.current_char is not None and self.current_char != quote_char:
-            if self.current_char == '\n':
-                raise LexerError("Chaîne non terminée", start_line)
-            result += self.current_char
-            self.advance()
+        start = self.pos + 1  # Après le guillemet ouvrant
         
-        if self.current_char is None:
+        # Chercher le guillemet fermant, sur la même ligne
+        end = self.text.find(quote_char, start)
+        newline = self.text.find('\n', start, end if end != -1 else self.length)
+        if end == -1 or newline != -1:
             raise LexerError("Chaîne non terminée", start_line)
         
-        self.advance()  # Passer le guillemet fermant
+        result = self.text[start:end]
+        self.jump_to(end + 1)  # Passer le guillemet fermant
         return Token('STRING', result, start_line)
     
     def read_identifier(self):
@@ -162,28 +240,40 @@ class Lexer:
         Returns:
             Token de type KEYWORD, TYPE ou IDENTIFIER
         """
-        result = ''
         start_line = self.line
+        match = _IDENTIFIER_RE.match(self.text, self.pos)
+        self.jump_to(match.end())
+        return self.word_token(match.group(), start_line)
+    
+    def word_token(self, word, line):
+        """
+        Construit le token d'un mot déjà découpé.
         
-        while self.current_char is not None and (self.current_char.isalnum() or self.current_char == '_'):
-            result += self.current_char
-            self.advance()
-        
-        upper_result = result.upper()
-        
+        Returns:
+            Token de type KEYWORD, TYPE ou IDENTIFIER
+        """
+        # Un seul accès au dictionnaire pour un mot déjà rencontré
+        entry = self._words.get(word)
+        if entry is None:
+            entry = self._words[word] = self.classify_word(word)
+        return Token(entry[0], entry[1], line)
+    
+    def classify_word(self, word):
+        """Retourne le couple (type de token, valeur) d'un mot."""
         # Les mots-clés doivent être en majuscules dans le code source
-        # (sauf pour les identificateurs qui commencent par une minuscule)
-        if result == upper_result or result[0].isupper():
-            # Vérifier si c'est un mot-clé
-            if upper_result in self.KEYWORDS:
-                return Token('KEYWORD', upper_result, start_line)
-            
-            # Vérifier si c'est un type
-            if upper_result in self.TYPES:
-                return Token('TYPE', upper_result, start_line)
+        # (sauf pour les identificateurs qui commencent par une minuscule):
+        # d'abord la forme exacte, puis la forme majuscule si la casse est mixte
+        reserved = self.RESERVED.get(word)
+        if reserved is None and word[0].isupper():
+            reserved = self.RESERVED.get(word.upper())
         
-        # Sinon c'est un identificateur
-        return Token('IDENTIFIER', result, start_line)
+        # Mot-clé ou type
+        if reserved is not None:
+            return reserved
+        
+        # Sinon c'est un identificateur (internalisé: les occurrences d'un
+        # même nom partagent la même chaîne dans tout le compilateur)
+        return ('IDENTIFIER', sys.intern(word))
     
     def tokenize(self):
         """
@@ -195,152 +285,187 @@ class Lexer:
         Raises:
             LexerError: Si un caractère invalide est rencontré
         """
-        tokens = []
+        return list(self._emit())
+    
+    def __iter__(self):
+        """Produit les tokens à la demande (voir TokenStream)."""
+        return self._emit()
+    
+    def _emit(self):
+        """
+        Générateur des tokens du texte, terminé par le token EOF.
         
-        while self.current_char is not None:
-            # Ignorer les espaces blancs
-            if self.current_char in ' \t\n\r':
-                self.skip_whitespace()
-                continue
-            
-            # Commentaires //
-            if self.current_char == '/' and self.peek() == '/':
-                self.skip_comment()
-                continue
+        Raises:
+            LexerError: Si un caractère invalide est rencontré
+        """
+        # Variables locales plutôt qu'attributs dans la boucle principale;
+        # self.pos n'est synchronisé qu'autour des appels aux read_*.
+        # Les mots et les nombres sont découpés par le moteur d'expressions
+        # régulières directement depuis la boucle: seuls les lexèmes complets
+        # deviennent des chaînes Python.
+        line_at = self.line_at
+        word_token = self.word_token
+        match_identifier = _IDENTIFIER_RE.match
+        match_number = _NUMBER_RE.match
+        text = self.text
+        length = self.length
+        pos = self.pos
+        
+        # Ordre des tests: du plus fréquent au plus rare, d'après les
+        # programmes de examples/ (espaces > identificateurs/mots-clés >
+        # ponctuation > nombres > chaînes > opérateurs de deux caractères).
+        # Conserver cet ordre lors des modifications.
+        while pos < length:
+            c = text[pos]
+            code = ord(c)
+            char_class = _CHAR_CLASS[code] if code < _CHAR_CLASS_SIZE else _classify(c)
             
-            # Nombres
-            if self.current_char.isdigit():
-                tokens.append(self.read_number())
-                continue
-            
-            # Chaînes de caractères
-            if self.current_char in '"\'':
-                tokens.append(self.read_string())
+            # Ignorer les espaces blancs (toute la suite d'un coup)
+            if char_class & _WHITESPACE:
+                pos += 1
+                while pos < length and text[pos] in _WS_SET:
+                    pos += 1
                 continue
             
             # Identificateurs et mots-clés
-            if self.current_char.isalpha() or self.current_char == '_':
-                tokens.append(self.read_identifier())
+            if char_class & _IDSTART:
+                match = match_identifier(text, pos)
+                yield word_token(match.group(), line_at(pos))
+                pos = match.end()
                 continue
             
-            # Opérateur d'affectation ←
-            if self.current_char == '←':
-                tokens.append(Token('ASSIGN', '←', self.line))
-                self.advance()
+            # Ponctuation et opérateurs d'un seul caractère: une recherche
+            # dans _PUNCT (une échelle match/case déroulée, même générée à
+            # partir de la table, teste les cas un par un et s'est révélée
+            # plus lente)
+            punct = _PUNCT.get(c)
+            if punct is not None:
+                yield Token(punct[0], punct[1], line_at(pos))
+                pos += 1
                 continue
             
-            # Alternative pour l'affectation: <-
-            if self.current_char == '<' and self.peek() == '-':
-                tokens.append(Token('ASSIGN', '←', self.line))
-                self.advance()
-                self.advance()
+            # Nombres
+            if char_class & _DIGIT:
+                # Entier d'un seul chiffre ASCII (le cas le plus courant):
+                # valeur calculée directement, sans regex ni int()
+                end = pos + 1
+                if code <= 57 and (end == length or not (text[end].isdigit() or text[end] == '.')):
+                    yield Token('NUMBER', code - 48, line_at(pos))
+                    pos = end
+                    continue
+                match = match_number(text, pos)
+                if match is None:
+                    self.jump_to(pos)
+                    raise LexerError(f"Caractère invalide '{c}'", self.line)
+                # Partie décimale (pour les réels)
+                if match.group(1):
+                    yield Token('REAL_NUMBER', float(match.group()), line_at(pos))
+                else:
+                    yield Token('NUMBER', int(match.group()), line_at(pos))
+                pos = match.end()
                 continue
             
-            # Opérateur différent ≠ ou <>
-            if self.current_char == '≠':
-                tokens.append(Token('OPERATOR', '≠', self.line))
-                self.advance()
+            # Chaînes de caractères
+            if char_class & _QUOTE:
+                self.jump_to(pos)
+                yield self.read_string()
+                pos = self.pos
                 continue
             
-            if self.current_char == '<' and self.peek() == '>':
-                tokens.append(Token('OPERATOR', '≠', self.line))
-                self.advance()
-                self.advance()
-                continue
+            next_char = text[pos + 1] if pos + 1 < length else None
             
-            # Opérateurs de comparaison
-            if self.current_char == '<':
-                if self.peek() == '=':
-                    tokens.append(Token('OPERATOR', '<=', self.line))
-                    self.advance()
-                    self.advance()
+            # Commentaires // (avant l'opérateur /)
+            if c == '/':
+                if next_char == '/':
+                    end = text.find('\n', pos)
+                    pos = end if end != -1 else length
                 else:
-                    tokens.append(Token('OPERATOR', '<', self.line))
-                    self.advance()
+                    yield Token('OPERATOR', '/', line_at(pos))
+                    pos += 1
                 continue
             
-            if self.current_char == '>':
-                if self.peek() == '=':
-                    tokens.append(Token('OPERATOR', '>=', self.line))
-                    self.advance()
-                    self.advance()
+            # Opérateurs de comparaison
+            if c == '>':
+                if next_char == '=':
+                    yield Token('OPERATOR', _GREATER_EQUAL, line_at(pos))
+                    pos += 2
                 else:
-                    tokens.append(Token('OPERATOR', '>', self.line))
-                    self.advance()
-                continue
-            
-            if self.current_char == '=':
-                tokens.append(Token('OPERATOR', '=', self.line))
-                self.advance()
-                continue
-            
-            # Opérateurs arithmétiques
-            if self.current_char == '+':
-                tokens.append(Token('OPERATOR', '+', self.line))
-                self.advance()
-                continue
-            
-            if self.current_char == '-':
-                tokens.append(Token('OPERATOR', '-', self.line))
-                self.advance()
-                continue
-            
-            if self.current_char == '*':
-                tokens.append(Token('OPERATOR', '*', self.line))
-                self.advance()
-                continue
-            
-            if self.current_char == '/':
-                tokens.append(Token('OPERATOR', '/', self.line))
-                self.advance()
-                continue
-            
-            # Symboles
-            if self.current_char == ':':
-                tokens.append(Token('COLON', ':', self.line))
-                self.advance()
-                continue
-            
-            if self.current_char == ',':
-                tokens.append(Token('COMMA', ',', self.line))
-                self.advance()
-                continue
-            
-            if self.current_char == '(':
-                tokens.append(Token('LPAREN', '(', self.line))
-                self.advance()
+                    yield Token('OPERATOR', '>', line_at(pos))
+                    pos += 1
                 continue
             
-            if self.current_char == ')':
-                tokens.append(Token('RPAREN', ')', self.line))
-                self.advance()
-                continue
-            
-            # Crochets pour les tableaux
-            if self.current_char == '[':
-                tokens.append(Token('LBRACKET', '[', self.line))
-                self.advance()
-                continue
-            
-            if self.current_char == ']':
-                tokens.append(Token('RBRACKET', ']', self.line))
-                self.advance()
+            # Opérateurs commençant par '<': <-, <>, <=, <
+            if c == '<':
+                # Alternative pour l'affectation: <-
+                if next_char == '-':
+                    yield Token('ASSIGN', _ASSIGN, line_at(pos))
+                    pos += 2
+                # Alternative pour différent: <>
+                elif next_char == '>':
+                    yield Token('OPERATOR', _NOT_EQUAL, line_at(pos))
+                    pos += 2
+                elif next_char == '=':
+                    yield Token('OPERATOR', _LESS_EQUAL, line_at(pos))
+                    pos += 2
+                else:
+                    yield Token('OPERATOR', '<', line_at(pos))
+                    pos += 1
                 continue
             
             # Caractère invalide
-            raise LexerError(f"Caractère invalide '{self.current_char}'", self.line)
+            self.jump_to(pos)
+            raise LexerError(f"Caractère invalide '{c}'", self.line)
         
-        # Ajouter un token de fin de fichier
-        tokens.append(Token('EOF', None, self.line))
+        self.jump_to(pos)
         
-        return tokens
+        # Ajouter un token de fin de fichier
+        yield Token('EOF', None, self.line)
+
+
+class TokenStream:
+    """
+    Flux de tokens consommé au fur et à mesure par le parser.
+    
+    Évite de construire la liste complète des tokens: seuls les tokens
+    regardés à l'avance (peek) sont conservés dans une petite file.
+    
+    Attributes:
+        last: Dernier token sorti du flux (pour les erreurs en fin de fichier)
+    """
+    
+    def __init__(self, tokens):
+        """
+        Args:
+            tokens: Itérable de Token (par exemple un Lexer)
+        """
+        self._tokens = iter(tokens)
+        self._lookahead = deque()
+        self.last = None
+    
+    def next(self):
+        """Retourne le token suivant, ou None à la fin du flux."""
+        if self._lookahead:
+            token = self._lookahead.popleft()
+        else:
+            token = next(self._tokens, None)
+        if token is not None:
+            self.last = token
+        return token
+    
+    def peek(self, offset=1):
+        """Regarde le offset-ième token suivant sans le consommer."""
+        lookahead = self._lookahead
+        while len(lookahead) < offset:
+            token = next(self._tokens, None)
+            if token is None:
+                return None
+            lookahead.append(token)
+        return lookahead[offset - 1]
 
 
 # Tests du lexer
 if __name__ == '__main__':
-    import sys
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
     # Test 1: Déclaration simple
     print("=== Test 1: Déclaration simple ===")
     lexer = Lexer("VAR x : ENTIER")
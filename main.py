@@ -12,20 +12,96 @@ Il passe par 4 phases: Lexer → Parser → Semantic → CodeGen
 
 import sys
 import os
+import hashlib
+import pickle
+import py_compile
+import tempfile
 
 # Configuration de l'encodage pour Windows
 if sys.platform == 'win32':
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
-from lexer import Lexer, LexerError
-from parser import Parser, ParserError
+from lexer import Lexer, LexerError, Token
+from parser import Parser, ParserError, ProgramNode
 from semantic import SemanticAnalyzer, SemanticError
 from codegen import CodeGenerator
 
 
-def compile_file(input_filename, output_filename=None, execute=False):
+# Cache des tokens et des AST: un source inchangé n'est pas réanalysé d'une
+# compilation à l'autre. Incrémenter TOKEN_CACHE_VERSION quand le lexer change
+# de sortie, AST_CACHE_VERSION quand le lexer ou le parser change d'AST.
+TOKEN_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pseudocomp')
+TOKEN_CACHE_VERSION = 1
+AST_CACHE_VERSION = 1
+
+
+def _cache_path(source_code, kind, version):
+    """Retourne le fichier de cache de ce type (tokens, ast) pour ce source."""
+    digest = hashlib.blake2b(source_code.encode('utf-8'), digest_size=16)
+    digest.update(str(version).encode('ascii'))
+    return os.path.join(TOKEN_CACHE_DIR, f"{digest.hexdigest()}.{kind}.pkl")
+
+
+def _load_cached(path):
+    """Retourne l'objet enregistré dans ce fichier de cache, ou None."""
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        # Le cache n'est qu'une optimisation: un fichier absent, tronqué ou
+        # corrompu (pickle peut alors lever à peu près n'importe quelle
+        # exception) compte comme une absence, le source est réanalysé
+        return None
+
+
+def _store_cached(path, value):
+    """Enregistre un objet en cache (écriture atomique, erreurs ignorées)."""
+    tmp_path = None
+    try:
+        os.makedirs(TOKEN_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=TOKEN_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f, protocol=5)
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError, RecursionError):
+        # AST trop profond pour pickle: on compile simplement sans cache
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_cached_tokens(source_code):
+    """Retourne les tokens en cache pour ce source, ou None."""
+    tokens = _load_cached(_cache_path(source_code, 'tokens', TOKEN_CACHE_VERSION))
+    # Un fichier lisible mais qui ne contient pas une liste de tokens est
+    # ignoré comme un fichier corrompu
+    if type(tokens) is not list or not all(type(token) is Token for token in tokens):
+        return None
+    return tokens
+
+
+def store_cached_tokens(source_code, tokens):
+    """Enregistre les tokens de ce source en cache."""
+    _store_cached(_cache_path(source_code, 'tokens', TOKEN_CACHE_VERSION), tokens)
+
+
+def load_cached_ast(source_code):
+    """Retourne l'AST (ProgramNode) en cache pour ce source, ou None."""
+    ast = _load_cached(_cache_path(source_code, 'ast', AST_CACHE_VERSION))
+    # Un fichier lisible mais qui ne contient pas un programme est ignoré
+    # comme un fichier corrompu
+    if not isinstance(ast, ProgramNode):
+        return None
+    return ast
+
+
+def store_cached_ast(source_code, ast):
+    """Enregistre l'AST de ce source en cache."""
+    _store_cached(_cache_path(source_code, 'ast', AST_CACHE_VERSION), ast)
+
+
+def compile_file(input_filename, output_filename=None, execute=False, numba=False,
+                 use_cache=True, all_errors=False):
     """
     Compile un fichier pseudocode en Python.
     
@@ -33,6 +109,10 @@ def compile_file(input_filename, output_filename=None, execute=False):
         input_filename: Chemin du fichier .algo source
         output_filename: Chemin du fichier .py de sortie (optionnel)
         execute: Si True, exécute le code généré après compilation
+        numba: Si True, décore les fonctions numériques avec @njit
+        use_cache: Si True, réutilise les tokens et l'AST d'un source déjà analysé
+        all_errors: Si True, signale toutes les erreurs sémantiques au lieu
+                    de s'arrêter à la première
         
     Returns:
         True si la compilation réussit, False sinon
@@ -55,21 +135,38 @@ def compile_file(input_filename, output_filename=None, execute=False):
         with open(input_filename, 'r', encoding='utf-8') as f:
             source_code = f.read()
         
+        # Un AST en cache saute les phases 1 et 2
+        ast = load_cached_ast(source_code) if use_cache else None
+        
         # ============================================
         # Phase 1: Analyse Lexicale
         # ============================================
         print("Phase 1: Analyse Lexicale...")
-        lexer = Lexer(source_code)
-        tokens = lexer.tokenize()
-        print(f"  ✓ {len(tokens)} tokens générés")
+        if ast is not None:
+            print(f"  ✓ ignorée (AST depuis le cache)")
+        else:
+            tokens = load_cached_tokens(source_code) if use_cache else None
+            if tokens is not None:
+                print(f"  ✓ {len(tokens)} tokens (depuis le cache)")
+            else:
+                lexer = Lexer(source_code)
+                tokens = lexer.tokenize()
+                if use_cache:
+                    store_cached_tokens(source_code, tokens)
+                print(f"  ✓ {len(tokens)} tokens générés")
         
         # ============================================
         # Phase 2: Analyse Syntaxique
         # ============================================
         print("Phase 2: Analyse Syntaxique...")
-        parser = Parser(tokens)
-        ast = parser.parse()
-        print(f"  ✓ AST construit: {ast.name}")
+        if ast is not None:
+            print(f"  ✓ AST construit: {ast.name} (depuis le cache)")
+        else:
+            parser = Parser(tokens)
+            ast = parser.parse()
+            if use_cache:
+                store_cached_ast(source_code, ast)
+            print(f"  ✓ AST construit: {ast.name}")
         print(f"    - {len(ast.declarations)} déclaration(s)")
         print(f"    - {len(ast.statements)} instruction(s)")
         
@@ -77,8 +174,13 @@ def compile_file(input_filename, output_filename=None, execute=False):
         # Phase 3: Analyse Sémantique
         # ============================================
         print("Phase 3: Analyse Sémantique...")
-        analyzer = SemanticAnalyzer()
+        analyzer = SemanticAnalyzer(strict=not all_errors)
         analyzer.analyze(ast)
+        if analyzer.errors:
+            for error in analyzer.errors:
+                print(f"  ✗ {error}")
+            print(f"  {len(analyzer.errors)} erreur(s) sémantique(s)")
+            return False
         print(f"  ✓ Aucune erreur sémantique")
         print(f"    - {len(analyzer.symbol_table.symbols)} variable(s) dans la table des symboles")
         
@@ -86,7 +188,7 @@ def compile_file(input_filename, output_filename=None, execute=False):
         # Phase 4: Génération de Code
         # ============================================
         print("Phase 4: Génération de Code...")
-        generator = CodeGenerator()
+        generator = CodeGenerator(enable_numba=numba)
         python_code = generator.generate(ast)
         print(f"  ✓ Code Python généré")
         
@@ -94,6 +196,19 @@ def compile_file(input_filename, output_filename=None, execute=False):
         with open(output_filename, 'w', encoding='utf-8') as f:
             f.write(python_code)
         
+        # L'objet code compilé ici sert à l'exécution (-r). py_compile relit
+        # ensuite le .py et le compile une seconde fois pour écrire le .pyc
+        # dans un __pycache__/ à côté du fichier généré: un import ultérieur
+        # du module n'aura pas à le recompiler. Le .pyc n'est qu'une
+        # optimisation: il n'est pas écrit sous -B (sys.dont_write_bytecode),
+        # et un échec (__pycache__ non inscriptible...) est ignoré
+        code_object = compile(python_code, output_filename, 'exec')
+        if not sys.dont_write_bytecode:
+            try:
+                py_compile.compile(output_filename, doraise=True)
+            except (py_compile.PyCompileError, OSError):
+                pass
+        
         print()
         print("=" * 60)
         print(f"  ✓ Compilation réussie!")
@@ -112,7 +227,7 @@ def compile_file(input_filename, output_filename=None, execute=False):
             print()
             print("Exécution du programme:")
             print("-" * 40)
-            exec(python_code)
+            exec(code_object, {'__name__': '__main__'})
             print("-" * 40)
         
         return True
@@ -149,6 +264,9 @@ USAGE:
     python main.py <fichier.algo>           Compile le fichier
     python main.py <fichier.algo> -r        Compile et exécute
     python main.py <fichier.algo> -o <out>  Spécifie le fichier de sortie
+    python main.py <fichier.algo> --numba   Compile les fonctions numériques avec Numba
+    python main.py <fichier.algo> --no-cache  Réanalyse le source sans cache de tokens ni d'AST
+    python main.py <fichier.algo> --all-errors  Signale toutes les erreurs sémantiques
     python main.py --help                   Affiche cette aide
 
 EXEMPLES:
@@ -180,6 +298,9 @@ def main():
     input_file = sys.argv[1]
     output_file = None
     execute = False
+    numba = False
+    use_cache = True
+    all_errors = False
     
     # Parser les options
     i = 2
@@ -192,12 +313,22 @@ def main():
         elif arg in ('-r', '--run'):
             execute = True
             i += 1
+        elif arg == '--numba':
+            numba = True
+            i += 1
+        elif arg == '--no-cache':
+            use_cache = False
+            i += 1
+        elif arg == '--all-errors':
+            all_errors = True
+            i += 1
         else:
             print(f"Option inconnue: {arg}")
             sys.exit(1)
     
     # Compiler
-    success = compile_file(input_file, output_file, execute)
+    success = compile_file(input_file, output_file, execute, numba, use_cache,
+                           all_errors)
     sys.exit(0 if success else 1)
 
 
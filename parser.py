@@ -6,7 +6,10 @@ Ce module prend la liste de tokens produite par le lexer et
 construit une structure d'arbre représentant le programme.
 """
 
-from lexer import Token, Lexer, LexerError
+import gc
+import sys
+
+from lexer import Token, Lexer, LexerError, TokenStream
 
 
 # ============================================================
@@ -14,8 +17,13 @@ from lexer import Token, Lexer, LexerError
 # ============================================================
 
 class ASTNode:
-    """Classe de base pour tous les noeuds de l'AST."""
-    pass
+    """
+    Classe de base pour tous les noeuds de l'AST.
+    
+    Chaque sous-classe déclare ses champs dans __slots__: pas de __dict__
+    par noeud, donc moins de mémoire et des accès aux attributs plus rapides.
+    """
+    __slots__ = ()
 
 
 class ProgramNode(ASTNode):
@@ -24,15 +32,17 @@ class ProgramNode(ASTNode):
     
     Attributes:
         name: Nom de l'algorithme
-        declarations: Liste des déclarations de variables
-        functions: Liste des définitions de fonctions
-        statements: Liste des instructions
+        declarations: Tuple des déclarations de variables
+        functions: Tuple des définitions de fonctions
+        statements: Tuple des instructions
     """
     
-    def __init__(self, name, declarations, statements, functions=None):
+    __slots__ = ('name', 'declarations', 'functions', 'statements')
+    
+    def __init__(self, name, declarations, statements, functions=()):
         self.name = name
         self.declarations = declarations
-        self.functions = functions or []
+        self.functions = functions if functions is not None else ()
         self.statements = statements
     
     def __repr__(self):
@@ -49,6 +59,8 @@ class DeclarationNode(ASTNode):
         line: Numéro de ligne pour les erreurs
     """
     
+    __slots__ = ('variable', 'var_type', 'line')
+    
     def __init__(self, variable, var_type, line=1):
         self.variable = variable
         self.var_type = var_type
@@ -68,6 +80,8 @@ class AssignmentNode(ASTNode):
         line: Numéro de ligne
     """
     
+    __slots__ = ('target', 'value', 'line')
+    
     def __init__(self, target, value, line=1):
         self.target = target
         self.value = value
@@ -85,9 +99,14 @@ class NumberNode(ASTNode):
         value: La valeur numérique
     """
     
+    __slots__ = ('value',)
+    
+    # Pas de ligne par instance: les littéraux sont partagés entre leurs
+    # occurrences (voir Parser.literal); line est accepté pour compatibilité
+    line = 1
+    
     def __init__(self, value, line=1):
         self.value = value
-        self.line = line
     
     def __repr__(self):
         return f"Number({self.value})"
@@ -101,9 +120,14 @@ class StringNode(ASTNode):
         value: La valeur de la chaîne
     """
     
+    __slots__ = ('value',)
+    
+    # Pas de ligne par instance: les littéraux sont partagés entre leurs
+    # occurrences (voir Parser.literal); line est accepté pour compatibilité
+    line = 1
+    
     def __init__(self, value, line=1):
         self.value = value
-        self.line = line
     
     def __repr__(self):
         return f"String({repr(self.value)})"
@@ -117,9 +141,14 @@ class BooleanNode(ASTNode):
         value: True ou False
     """
     
+    __slots__ = ('value',)
+    
+    # Pas de ligne par instance: les littéraux sont partagés entre leurs
+    # occurrences (voir Parser.literal); line est accepté pour compatibilité
+    line = 1
+    
     def __init__(self, value, line=1):
         self.value = value
-        self.line = line
     
     def __repr__(self):
         return f"Boolean({self.value})"
@@ -133,6 +162,8 @@ class VariableNode(ASTNode):
         name: Nom de la variable
     """
     
+    __slots__ = ('name', 'line')
+    
     def __init__(self, name, line=1):
         self.name = name
         self.line = line
@@ -151,6 +182,8 @@ class BinaryOpNode(ASTNode):
         right: Opérande droite
     """
     
+    __slots__ = ('left', 'operator', 'right', 'line')
+    
     def __init__(self, left, operator, right, line=1):
         self.left = left
         self.operator = operator
@@ -170,6 +203,8 @@ class UnaryOpNode(ASTNode):
         operand: L'opérande
     """
     
+    __slots__ = ('operator', 'operand', 'line')
+    
     def __init__(self, operator, operand, line=1):
         self.operator = operator
         self.operand = operand
@@ -184,13 +219,21 @@ class PrintNode(ASTNode):
     Représente une instruction ECRIRE: ECRIRE(x)
     
     Attributes:
-        expressions: Liste d'expressions à afficher
+        expressions: Liste d'expressions à afficher (toujours une liste,
+                     voir PrintNode.single pour une seule expression)
     """
     
+    __slots__ = ('expressions', 'line')
+    
     def __init__(self, expressions, line=1):
-        self.expressions = expressions if isinstance(expressions, list) else [expressions]
+        self.expressions = expressions
         self.line = line
     
+    @classmethod
+    def single(cls, expression, line=1):
+        """Construit un ECRIRE d'une seule expression."""
+        return cls([expression], line)
+    
     def __repr__(self):
         return f"Print({self.expressions})"
 
@@ -203,9 +246,12 @@ class ReadNode(ASTNode):
         variable: Nom de la variable à lire
     """
     
+    __slots__ = ('variable', 'line', 'var_type')
+    
     def __init__(self, variable, line=1):
         self.variable = variable
         self.line = line
+        self.var_type = None  # Renseigné par l'analyse sémantique
     
     def __repr__(self):
         return f"Read({self.variable})"
@@ -217,10 +263,12 @@ class IfNode(ASTNode):
     
     Attributes:
         condition: Expression de condition
-        then_branch: Liste d'instructions si vrai
-        else_branch: Liste d'instructions si faux (peut être None)
+        then_branch: Tuple d'instructions si vrai
+        else_branch: Tuple d'instructions si faux (peut être None)
     """
     
+    __slots__ = ('condition', 'then_branch', 'else_branch', 'line')
+    
     def __init__(self, condition, then_branch, else_branch=None, line=1):
         self.condition = condition
         self.then_branch = then_branch
@@ -239,9 +287,11 @@ class WhileNode(ASTNode):
     
     Attributes:
         condition: Expression de condition
-        body: Liste d'instructions du corps de la boucle
+        body: Tuple d'instructions du corps de la boucle
     """
     
+    __slots__ = ('condition', 'body', 'line')
+    
     def __init__(self, condition, body, line=1):
         self.condition = condition
         self.body = body
@@ -259,9 +309,11 @@ class ForNode(ASTNode):
         variable: Variable de boucle
         start: Expression de début
         end: Expression de fin
-        body: Liste d'instructions du corps
+        body: Tuple d'instructions du corps
     """
     
+    __slots__ = ('variable', 'start', 'end', 'body', 'line')
+    
     def __init__(self, variable, start, end, body, line=1):
         self.variable = variable
         self.start = start
@@ -280,15 +332,17 @@ class FunctionDefNode(ASTNode):
     
     Attributes:
         name: Nom de la fonction
-        parameters: Liste de tuples (nom, type)
+        parameters: Tuple de couples (nom, type)
         return_type: Type de retour (peut être None pour procédure)
         declarations: Déclarations locales
-        body: Liste d'instructions
+        body: Tuple d'instructions
     """
     
+    __slots__ = ('name', 'parameters', 'return_type', 'declarations', 'body', 'line')
+    
     def __init__(self, name, parameters, return_type, declarations, body, line=1):
         self.name = name
-        self.parameters = parameters  # [(nom, type), ...]
+        self.parameters = parameters  # ((nom, type), ...)
         self.return_type = return_type
         self.declarations = declarations
         self.body = body
@@ -308,6 +362,8 @@ class FunctionCallNode(ASTNode):
         arguments: Liste d'expressions (arguments)
     """
     
+    __slots__ = ('name', 'arguments', 'line')
+    
     def __init__(self, name, arguments, line=1):
         self.name = name
         self.arguments = arguments
@@ -325,6 +381,8 @@ class ReturnNode(ASTNode):
         value: Expression à retourner
     """
     
+    __slots__ = ('value', 'line')
+    
     def __init__(self, value, line=1):
         self.value = value
         self.line = line
@@ -344,6 +402,8 @@ class ArrayDeclarationNode(ASTNode):
         line: Numéro de ligne
     """
     
+    __slots__ = ('variable', 'size', 'element_type', 'line')
+    
     def __init__(self, variable, size, element_type, line=1):
         self.variable = variable
         self.size = size
@@ -364,6 +424,8 @@ class ArrayAccessNode(ASTNode):
         line: Numéro de ligne
     """
     
+    __slots__ = ('array_name', 'index', 'line')
+    
     def __init__(self, array_name, index, line=1):
         self.array_name = array_name
         self.index = index
@@ -384,6 +446,8 @@ class ArrayAssignmentNode(ASTNode):
         line: Numéro de ligne
     """
     
+    __slots__ = ('array_name', 'index', 'value', 'line')
+    
     def __init__(self, array_name, index, value, line=1):
         self.array_name = array_name
         self.index = index
@@ -394,6 +458,25 @@ class ArrayAssignmentNode(ASTNode):
         return f"ArrayAssign({self.array_name}[{self.index}] = {self.value})"
 
 
+# Précédence des opérateurs binaires (voir parse_expression); les valeurs
+# sont internalisées comme dans le lexer, la recherche réussit donc par
+# identité. NON se place entre ET et les comparaisons.
+_BINARY_PRECEDENCE = {
+    'OU': 1,
+    'ET': 2,
+    **{sys.intern(op): 3 for op in ('=', '<', '>', '<=', '>=', '≠')},
+    '+': 4, '-': 4,
+    '*': 5, '/': 5,
+}
+_NOT_PRECEDENCE = 3
+_BINARY_OPERATOR_TYPES = frozenset(('OPERATOR', 'KEYWORD'))
+
+# Tokens littéraux → classe de noeud, et mots-clés booléens → valeur
+# (voir parse_primary)
+_LITERAL_NODES = {'NUMBER': NumberNode, 'REAL_NUMBER': NumberNode, 'STRING': StringNode}
+_BOOLEAN_KEYWORDS = {'VRAI': True, 'FAUX': False}
+
+
 # ============================================================
 # Erreur de syntaxe
 # ============================================================
@@ -404,7 +487,11 @@ class ParserError(Exception):
     def __init__(self, message, line):
         self.message = message
         self.line = line
-        super().__init__(f"Erreur Syntaxique (ligne {line}): {message}")
+        super().__init__(message, line)
+    
+    def __str__(self):
+        # Message formaté seulement s'il est affiché
+        return f"Erreur Syntaxique (ligne {self.line}): {self.message}"
 
 
 # ============================================================
@@ -419,32 +506,117 @@ class Parser:
     pour construire l'AST à partir des tokens.
     """
     
+    # Longueur maximale d'une chaîne littérale partagée (voir literal)
+    MAX_SHARED_STRING = 64
+    
     def __init__(self, tokens):
         """
         Initialise le parser avec la liste de tokens.
         
         Args:
-            tokens: Liste de Token produite par le Lexer
+            tokens: Liste de Token produite par le Lexer, ou TokenStream
+                    pour consommer les tokens au fur et à mesure
         """
-        self.tokens = tokens
         self.pos = 0
-        self.current_token = tokens[0] if tokens else None
+        self._literals = {}  # (classe, type, valeur) → noeud littéral partagé
+        self._variables = {}  # (nom, ligne) → VariableNode partagé
+        
+        # Table de dispatch: mot-clé de début d'instruction → méthode
+        self._statement_dispatch = {
+            'ECRIRE': self.parse_print,
+            'LIRE': self.parse_read,
+            'SI': self.parse_if,
+            'TANT_QUE': self.parse_while,
+            'POUR': self.parse_for,
+            'RETOURNER': self.parse_return,
+        }
+        if isinstance(tokens, TokenStream):
+            self.stream = tokens
+            self.tokens = None
+            self.set_current(tokens.next())
+        else:
+            self.stream = None
+            self.tokens = tokens
+            self.set_current(tokens[0] if tokens else None)
+    
+    def set_current(self, token):
+        """
+        Définit le token actuel.
+        
+        Son type et sa valeur sont recopiés dans current_type et
+        current_value (None en fin de tokens), lus directement par match,
+        eat et les boucles d'expressions.
+        """
+        self.current_token = token
+        if token is None:
+            self.current_type = self.current_value = None
+        else:
+            self.current_type = token.type
+            self.current_value = token.value
     
     def advance(self):
         """Avance au token suivant."""
         self.pos += 1
-        if self.pos < len(self.tokens):
-            self.current_token = self.tokens[self.pos]
+        # Même mise à jour que set_current, écrite en ligne (un appel par token)
+        if self.stream is not None:
+            token = self.stream.next()
+        elif self.pos < len(self.tokens):
+            token = self.tokens[self.pos]
+        else:
+            token = None
+        self.current_token = token
+        if token is None:
+            self.current_type = self.current_value = None
         else:
-            self.current_token = None
+            self.current_type = token.type
+            self.current_value = token.value
     
     def peek(self, offset=1):
         """Regarde un token à l'avance sans avancer."""
+        if self.stream is not None:
+            return self.stream.peek(offset)
         peek_pos = self.pos + offset
         if peek_pos < len(self.tokens):
             return self.tokens[peek_pos]
         return None
     
+    def literal(self, node_class, value, line):
+        """
+        Retourne le noeud littéral (NumberNode, StringNode, BooleanNode)
+        pour cette valeur, partagé entre toutes ses occurrences.
+        
+        Les littéraux ne portent pas de ligne: les erreurs sont signalées
+        sur l'opération ou l'instruction englobante, jamais sur un littéral.
+        """
+        # type(value) distingue 1 de 1.0 (égaux et de même hash)
+        key = (node_class, type(value), value)
+        node = self._literals.get(key)
+        if node is None:
+            node = self._literals[key] = node_class(value, line)
+        return node
+    
+    def variable(self, name, line):
+        """
+        Retourne le noeud VariableNode pour ce nom à cette ligne, partagé
+        entre les occurrences de la même ligne (x * x, t[i] + i, ...).
+        
+        La ligne fait partie de la clé: elle sert aux erreurs de variable
+        non déclarée.
+        """
+        key = (name, line)
+        node = self._variables.get(key)
+        if node is None:
+            node = self._variables[key] = VariableNode(name, line)
+        return node
+    
+    def last_line(self):
+        """Ligne du dernier token (pour les erreurs en fin de fichier)."""
+        if self.stream is not None:
+            last = self.stream.last
+        else:
+            last = self.tokens[-1] if self.tokens else None
+        return last.line if last is not None else 1
+    
     def eat(self, token_type, expected_value=None):
         """
         Consomme un token du type attendu.
@@ -456,23 +628,23 @@ class Parser:
         Raises:
             ParserError: Si le token ne correspond pas
         """
-        if self.current_token is None:
+        token = self.current_token
+        if token is None:
             raise ParserError(f"Fin de fichier inattendue, attendu {token_type}", 
-                            self.tokens[-1].line if self.tokens else 1)
+                            self.last_line())
         
-        if self.current_token.type != token_type:
+        if token.type != token_type:
             raise ParserError(
-                f"Attendu {token_type}, trouvé {self.current_token.type} ('{self.current_token.value}')",
-                self.current_token.line
+                f"Attendu {token_type}, trouvé {token.type} ('{token.value}')",
+                token.line
             )
         
-        if expected_value is not None and self.current_token.value != expected_value:
+        if expected_value is not None and token.value != expected_value:
             raise ParserError(
-                f"Attendu '{expected_value}', trouvé '{self.current_token.value}'",
-                self.current_token.line
+                f"Attendu '{expected_value}', trouvé '{token.value}'",
+                token.line
             )
         
-        token = self.current_token
         self.advance()
         return token
     
@@ -483,13 +655,9 @@ class Parser:
         Returns:
             True si ça correspond, False sinon
         """
-        if self.current_token is None:
-            return False
-        if self.current_token.type != token_type:
+        if self.current_type != token_type:
             return False
-        if expected_value is not None and self.current_token.value != expected_value:
-            return False
-        return True
+        return expected_value is None or self.current_value == expected_value
     
     # ========================================
     # Règles de grammaire
@@ -499,9 +667,23 @@ class Parser:
         """
         Parse un programme complet.
         
+        Le ramasse-miettes cyclique est suspendu pendant l'analyse: l'AST
+        est créé d'un bloc, ne contient pas de cycles et vit jusqu'à la fin
+        de la compilation, ses collectes intermédiaires sont donc inutiles.
+        
         Grammar:
             program → ALGORITHME identifier declarations functions DEBUT statements FIN
         """
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self.parse_program()
+        finally:
+            if gc_enabled:
+                gc.enable()
+    
+    def parse_program(self):
+        """Parse un programme complet (voir parse)."""
         # ALGORITHME nom
         self.eat('KEYWORD', 'ALGORITHME')
         name_token = self.eat('IDENTIFIER')
@@ -521,16 +703,12 @@ class Parser:
         self.eat('KEYWORD', 'DEBUT')
         
         # Instructions
-        statements = []
-        while not self.match('KEYWORD', 'FIN'):
-            if self.current_token is None or self.match('EOF'):
-                raise ParserError("Mot-clé FIN manquant", self.tokens[-1].line)
-            statements.append(self.parse_statement())
+        statements = self.parse_block(('FIN',), "Mot-clé FIN manquant")
         
         # FIN
         self.eat('KEYWORD', 'FIN')
         
-        return ProgramNode(name, declarations, statements, functions)
+        return ProgramNode(name, tuple(declarations), statements, tuple(functions))
     
     def parse_declaration(self):
         """
@@ -605,15 +783,39 @@ class Parser:
             declarations.append(self.parse_declaration())
         
         # Corps de la fonction
-        body = []
-        while not self.match('KEYWORD', 'FIN_FONCTION'):
-            if self.current_token is None or self.match('EOF'):
-                raise ParserError("FIN_FONCTION manquant", line)
-            body.append(self.parse_statement())
+        body = self.parse_block(('FIN_FONCTION',), "FIN_FONCTION manquant", line)
         
         self.eat('KEYWORD', 'FIN_FONCTION')
         
-        return FunctionDefNode(func_name, parameters, return_type, declarations, body, line)
+        return FunctionDefNode(func_name, tuple(parameters), return_type,
+                               tuple(declarations), body, line)
+    
+    def parse_block(self, terminators, error_message, error_line=None):
+        """
+        Parse une suite d'instructions jusqu'à l'un des mots-clés de fin
+        (non consommé).
+        
+        Args:
+            terminators: Mots-clés qui ferment le bloc, ex. ('SINON', 'FIN_SI')
+            error_message: Message si le fichier se termine avant la fin du bloc
+            error_line: Ligne de cette erreur (None: ligne du dernier token)
+            
+        Returns:
+            Le tuple des instructions du bloc
+        """
+        statements = []
+        # Méthodes liées et token lus en variables locales
+        append = statements.append
+        parse_statement = self.parse_statement
+        while True:
+            token_type = self.current_type
+            if token_type == 'KEYWORD' and self.current_value in terminators:
+                break
+            if token_type is None or token_type == 'EOF':
+                raise ParserError(error_message,
+                                  self.last_line() if error_line is None else error_line)
+            append(parse_statement())
+        return tuple(statements)
     
     def parse_statement(self):
         """
@@ -622,38 +824,35 @@ class Parser:
         Grammar:
             statement → assignment | array_assignment | print | read | if | while | for | return
         """
-        if self.match('IDENTIFIER'):
+        token = self.current_token
+        
+        if token.type == 'IDENTIFIER':
             # Vérifier si c'est un appel de fonction, un accès tableau, ou une affectation
-            next_token = self.peek()
-            if next_token and next_token.type == 'LPAREN':
-                return self.parse_function_call_statement()
-            elif next_token and next_token.type == 'LBRACKET':
-                return self.parse_array_assignment()
+            # (lecture directe du token suivant, sans passer par peek)
+            tokens = self.tokens
+            if tokens is None:
+                next_token = self.stream.peek()
+            else:
+                next_pos = self.pos + 1
+                next_token = tokens[next_pos] if next_pos < len(tokens) else None
+            if next_token is not None:
+                next_type = next_token.type
+                if next_type == 'LPAREN':
+                    return self.parse_function_call_statement()
+                if next_type == 'LBRACKET':
+                    return self.parse_array_assignment()
             return self.parse_assignment()
         
-        elif self.match('KEYWORD', 'ECRIRE'):
-            return self.parse_print()
-        
-        elif self.match('KEYWORD', 'LIRE'):
-            return self.parse_read()
-        
-        elif self.match('KEYWORD', 'SI'):
-            return self.parse_if()
-        
-        elif self.match('KEYWORD', 'TANT_QUE'):
-            return self.parse_while()
+        # Instruction introduite par un mot-clé: un seul accès à la table
+        if token.type == 'KEYWORD':
+            handler = self._statement_dispatch.get(token.value)
+            if handler is not None:
+                return handler()
         
-        elif self.match('KEYWORD', 'POUR'):
-            return self.parse_for()
-        
-        elif self.match('KEYWORD', 'RETOURNER'):
-            return self.parse_return()
-        
-        else:
-            raise ParserError(
-                f"Instruction inattendue: {self.current_token.value}",
-                self.current_token.line
-            )
+        raise ParserError(
+            f"Instruction inattendue: {token.value}",
+            token.line
+        )
     
     def parse_function_call_statement(self):
         """Parse un appel de fonction comme instruction."""
@@ -701,12 +900,11 @@ class Parser:
         Grammar:
             assignment → identifier ← expression
         """
-        line = self.current_token.line
-        var_name = self.eat('IDENTIFIER').value
+        target = self.eat('IDENTIFIER')
         self.eat('ASSIGN')
         value = self.parse_expression()
         
-        return AssignmentNode(var_name, value, line)
+        return AssignmentNode(target.value, value, target.line)
     
     def parse_array_assignment(self):
         """
@@ -775,20 +973,12 @@ class Parser:
         
         self.eat('KEYWORD', 'ALORS')
         
-        then_branch = []
-        while not self.match('KEYWORD', 'SINON') and not self.match('KEYWORD', 'FIN_SI'):
-            if self.current_token is None or self.match('EOF'):
-                raise ParserError("FIN_SI manquant", line)
-            then_branch.append(self.parse_statement())
+        then_branch = self.parse_block(('SINON', 'FIN_SI'), "FIN_SI manquant", line)
         
         else_branch = None
         if self.match('KEYWORD', 'SINON'):
             self.eat('KEYWORD', 'SINON')
-            else_branch = []
-            while not self.match('KEYWORD', 'FIN_SI'):
-                if self.current_token is None or self.match('EOF'):
-                    raise ParserError("FIN_SI manquant", line)
-                else_branch.append(self.parse_statement())
+            else_branch = self.parse_block(('FIN_SI',), "FIN_SI manquant", line)
         
         self.eat('KEYWORD', 'FIN_SI')
         
@@ -808,11 +998,7 @@ class Parser:
         
         self.eat('KEYWORD', 'FAIRE')
         
-        body = []
-        while not self.match('KEYWORD', 'FIN_TANT_QUE'):
-            if self.current_token is None or self.match('EOF'):
-                raise ParserError("FIN_TANT_QUE manquant", line)
-            body.append(self.parse_statement())
+        body = self.parse_block(('FIN_TANT_QUE',), "FIN_TANT_QUE manquant", line)
         
         self.eat('KEYWORD', 'FIN_TANT_QUE')
         
@@ -838,11 +1024,7 @@ class Parser:
         
         self.eat('KEYWORD', 'FAIRE')
         
-        body = []
-        while not self.match('KEYWORD', 'FIN_POUR'):
-            if self.current_token is None or self.match('EOF'):
-                raise ParserError("FIN_POUR manquant", line)
-            body.append(self.parse_statement())
+        body = self.parse_block(('FIN_POUR',), "FIN_POUR manquant", line)
         
         self.eat('KEYWORD', 'FIN_POUR')
         
@@ -852,118 +1034,54 @@ class Parser:
     # Expressions (avec précédence d'opérateurs)
     # ========================================
     
-    def parse_expression(self):
+    def parse_expression(self, min_precedence=1, left=None):
         """
-        Parse une expression.
+        Parse une expression par montée de précédence (precedence climbing).
         
-        Grammar:
-            expression → or_expr
-        """
-        return self.parse_or_expr()
-    
-    def parse_or_expr(self):
-        """
-        Parse une expression OU.
+        Une seule boucle traite tous les opérateurs binaires au lieu d'une
+        méthode par niveau: une feuille ne coûte plus un appel par niveau.
         
         Grammar:
+            expression → or_expr
             or_expr → and_expr (OU and_expr)*
-        """
-        left = self.parse_and_expr()
-        
-        while self.match('KEYWORD', 'OU'):
-            line = self.current_token.line
-            self.eat('KEYWORD', 'OU')
-            right = self.parse_and_expr()
-            left = BinaryOpNode(left, 'OU', right, line)
-        
-        return left
-    
-    def parse_and_expr(self):
-        """
-        Parse une expression ET.
-        
-        Grammar:
             and_expr → not_expr (ET not_expr)*
-        """
-        left = self.parse_not_expr()
-        
-        while self.match('KEYWORD', 'ET'):
-            line = self.current_token.line
-            self.eat('KEYWORD', 'ET')
-            right = self.parse_not_expr()
-            left = BinaryOpNode(left, 'ET', right, line)
-        
-        return left
-    
-    def parse_not_expr(self):
-        """
-        Parse une expression NON.
-        
-        Grammar:
             not_expr → NON not_expr | comparison
-        """
-        if self.match('KEYWORD', 'NON'):
-            line = self.current_token.line
-            self.eat('KEYWORD', 'NON')
-            operand = self.parse_not_expr()
-            return UnaryOpNode('NON', operand, line)
-        
-        return self.parse_comparison()
-    
-    def parse_comparison(self):
-        """
-        Parse une comparaison.
-        
-        Grammar:
             comparison → additive ((= | < | > | <= | >= | ≠) additive)*
-        """
-        left = self.parse_additive()
-        
-        while self.current_token and self.current_token.type == 'OPERATOR' and \
-              self.current_token.value in ('=', '<', '>', '<=', '>=', '≠'):
-            line = self.current_token.line
-            op = self.current_token.value
-            self.advance()
-            right = self.parse_additive()
-            left = BinaryOpNode(left, op, right, line)
-        
-        return left
-    
-    def parse_additive(self):
-        """
-        Parse une expression additive.
-        
-        Grammar:
             additive → multiplicative ((+ | -) multiplicative)*
-        """
-        left = self.parse_multiplicative()
-        
-        while self.current_token and self.current_token.type == 'OPERATOR' and \
-              self.current_token.value in ('+', '-'):
-            line = self.current_token.line
-            op = self.current_token.value
-            self.advance()
-            right = self.parse_multiplicative()
-            left = BinaryOpNode(left, op, right, line)
-        
-        return left
-    
-    def parse_multiplicative(self):
-        """
-        Parse une expression multiplicative.
-        
-        Grammar:
             multiplicative → unary ((* | /) unary)*
-        """
-        left = self.parse_unary()
         
-        while self.current_token and self.current_token.type == 'OPERATOR' and \
-              self.current_token.value in ('*', '/'):
-            line = self.current_token.line
-            op = self.current_token.value
+        Args:
+            min_precedence: Précédence minimale des opérateurs consommés
+                            (voir _BINARY_PRECEDENCE)
+            left: Opérande gauche déjà parsé, dont on poursuit les
+                  opérateurs binaires (voir parse_primary)
+        """
+        # Opérande gauche: NON n'est admis qu'aux niveaux OU/ET/comparaison,
+        # et porte sur toute la comparaison qui suit
+        if left is None:
+            if min_precedence <= _NOT_PRECEDENCE and self.current_type == 'KEYWORD' \
+                    and self.current_value == 'NON':
+                line = self.current_token.line
+                self.advance()
+                left = UnaryOpNode('NON', self.parse_expression(_NOT_PRECEDENCE), line)
+            elif self.current_type == 'OPERATOR' and self.current_value == '-':
+                left = self.parse_unary()
+            else:
+                # Cas courant sans préfixe: parse_unary n'y ferait que
+                # transmettre l'appel à parse_primary
+                left = self.parse_primary()
+        
+        # Opérateurs binaires, associatifs à gauche (token lu une fois par
+        # tour dans une variable locale)
+        while self.current_type in _BINARY_OPERATOR_TYPES:
+            token = self.current_token
+            op = token.value
+            precedence = _BINARY_PRECEDENCE.get(op)
+            if precedence is None or precedence < min_precedence:
+                break
             self.advance()
-            right = self.parse_unary()
-            left = BinaryOpNode(left, op, right, line)
+            right = self.parse_expression(precedence + 1)
+            left = BinaryOpNode(left, op, right, token.line)
         
         return left
     
@@ -974,12 +1092,11 @@ class Parser:
         Grammar:
             unary → -unary | primary
         """
-        if self.current_token and self.current_token.type == 'OPERATOR' and \
-           self.current_token.value == '-':
-            line = self.current_token.line
+        token = self.current_token
+        if self.current_type == 'OPERATOR' and token.value == '-':
             self.advance()
             operand = self.parse_unary()
-            return UnaryOpNode('-', operand, line)
+            return UnaryOpNode('-', operand, token.line)
         
         return self.parse_primary()
     
@@ -993,37 +1110,15 @@ class Parser:
         token = self.current_token
         
         if token is None:
-            raise ParserError("Expression attendue", self.tokens[-1].line)
-        
-        # Nombre entier
-        if token.type == 'NUMBER':
-            self.advance()
-            return NumberNode(token.value, token.line)
-        
-        # Nombre réel
-        if token.type == 'REAL_NUMBER':
-            self.advance()
-            return NumberNode(token.value, token.line)
-        
-        # Chaîne
-        if token.type == 'STRING':
-            self.advance()
-            return StringNode(token.value, token.line)
-        
-        # Booléens
-        if token.type == 'KEYWORD' and token.value == 'VRAI':
-            self.advance()
-            return BooleanNode(True, token.line)
-        
-        if token.type == 'KEYWORD' and token.value == 'FAUX':
-            self.advance()
-            return BooleanNode(False, token.line)
+            raise ParserError("Expression attendue", self.last_line())
         
-        # Identificateur (variable ou appel de fonction)
+        # Identificateur (variable ou appel de fonction): le cas le plus
+        # fréquent, testé en premier
         if token.type == 'IDENTIFIER':
             self.advance()
+            next_type = self.current_type
             # Vérifier si c'est un appel de fonction
-            if self.match('LPAREN'):
+            if next_type == 'LPAREN':
                 self.eat('LPAREN')
                 arguments = []
                 if not self.match('RPAREN'):
@@ -1034,18 +1129,42 @@ class Parser:
                 self.eat('RPAREN')
                 return FunctionCallNode(token.value, arguments, token.line)
             # Vérifier si c'est un accès tableau
-            if self.match('LBRACKET'):
+            if next_type == 'LBRACKET':
                 self.eat('LBRACKET')
                 index = self.parse_expression()
                 self.eat('RBRACKET')
                 return ArrayAccessNode(token.value, index, token.line)
-            return VariableNode(token.value, token.line)
+            return self.variable(token.value, token.line)
         
-        # Expression entre parenthèses
-        if token.type == 'LPAREN':
+        # Littéraux: nombre entier, réel ou chaîne
+        node_class = _LITERAL_NODES.get(token.type)
+        if node_class is not None:
             self.advance()
+            if node_class is StringNode and len(token.value) > self.MAX_SHARED_STRING:
+                return StringNode(token.value, token.line)
+            return self.literal(node_class, token.value, token.line)
+        
+        # Booléens
+        if token.type == 'KEYWORD':
+            value = _BOOLEAN_KEYWORDS.get(token.value)
+            if value is not None:
+                self.advance()
+                return self.literal(BooleanNode, value, token.line)
+        
+        # Expression entre parenthèses: les parenthèses ouvrantes consécutives
+        # sont consommées en boucle, puis chaque niveau est refermé en
+        # poursuivant son expression à partir du niveau intérieur
+        # (((x)) ou ((a) + b) sans une récursion par parenthèse)
+        if token.type == 'LPAREN':
+            depth = 0
+            while self.current_type == 'LPAREN':
+                self.advance()
+                depth += 1
             expr = self.parse_expression()
             self.eat('RPAREN')
+            for _ in range(depth - 1):
+                expr = self.parse_expression(left=expr)
+                self.eat('RPAREN')
             return expr
         
         raise ParserError(f"Expression inattendue: {token.value}", token.line)
@@ -1056,9 +1175,7 @@ class Parser:
 # ============================================================
 
 if __name__ == '__main__':
-    import sys
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
     
     # Test 1: Programme simple
     print("=== Test 1: Programme simple ===")
@@ -1180,4 +1297,18 @@ FIN
         print(f"Erreur capturée: {e}")
     print()
     
+    # Test 7: Tokens consommés à la demande (TokenStream)
+    print("=== Test 7: Flux de tokens ===")
+    code = """ALGORITHME TestFlux
+VAR x : ENTIER
+DEBUT
+    x ← 2 * (3 + 4)
+    ECRIRE(x)
+FIN
+"""
+    ast = Parser(TokenStream(Lexer(code))).parse()
+    print(f"Programme: {ast}")
+    print(f"  Statements: {ast.statements}")
+    print()
+    
     print("✓ Tous les tests du parser terminés!")
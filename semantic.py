@@ -8,6 +8,8 @@ Ce module analyse l'AST pour détecter les erreurs sémantiques:
 - Vérification complète des types
 """
 
+import sys
+
 from parser import (
     ASTNode, ProgramNode, DeclarationNode, ArrayDeclarationNode, AssignmentNode,
     NumberNode, StringNode, BooleanNode, VariableNode, ArrayAccessNode, ArrayAssignmentNode,
@@ -40,6 +42,7 @@ class SymbolTable:
     def __init__(self):
         """Initialise une table des symboles vide."""
         self.symbols = {}  # {nom: {'type': type, 'line': ligne}}
+        self._scopes = []  # Noms déclarés dans chaque portée locale ouverte
     
     def declare(self, name, var_type, line, is_array=False, array_size=None):
         """
@@ -55,8 +58,9 @@ class SymbolTable:
         Raises:
             SemanticError: Si la variable est déjà déclarée
         """
-        if name in self.symbols:
-            original_line = self.symbols[name]['line']
+        existing = self.symbols.get(name)
+        if existing is not None:
+            original_line = existing['line']
             raise SemanticError(
                 f"Variable '{name}' déjà déclarée à la ligne {original_line}",
                 line
@@ -68,6 +72,8 @@ class SymbolTable:
             'is_array': is_array,
             'array_size': array_size
         }
+        if self._scopes:
+            self._scopes[-1].append(name)
     
     def lookup(self, name, line=None):
         """
@@ -83,13 +89,15 @@ class SymbolTable:
         Raises:
             SemanticError: Si la variable n'est pas déclarée
         """
-        if name not in self.symbols:
+        # Une seule recherche dans la table (pas de test in puis [])
+        symbol = self.symbols.get(name)
+        if symbol is None:
             raise SemanticError(
                 f"Variable '{name}' utilisée sans être déclarée",
                 line
             )
         
-        return self.symbols[name]
+        return symbol
     
     def exists(self, name):
         """
@@ -113,8 +121,9 @@ class SymbolTable:
         Returns:
             Le type de la variable ou None si non déclarée
         """
-        if name in self.symbols:
-            return self.symbols[name]['type']
+        symbol = self.symbols.get(name)
+        if symbol is not None:
+            return symbol['type']
         return None
     
     def is_array(self, name):
@@ -127,10 +136,28 @@ class SymbolTable:
         Returns:
             True si la variable est un tableau, False sinon
         """
-        if name in self.symbols:
-            return self.symbols[name].get('is_array', False)
+        symbol = self.symbols.get(name)
+        if symbol is not None:
+            return symbol['is_array']
         return False
     
+    def push_scope(self):
+        """
+        Ouvre une portée locale (corps de fonction).
+        
+        Les variables globales restent visibles; les noms déclarés ensuite
+        sont retirés par pop_scope. Une variable locale ne peut pas masquer
+        une globale (declare la refuse), retirer ces noms suffit donc à
+        retrouver la table d'avant, sans la copier.
+        """
+        self._scopes.append([])
+    
+    def pop_scope(self):
+        """Ferme la portée locale courante et oublie ses variables."""
+        symbols = self.symbols
+        for name in self._scopes.pop():
+            del symbols[name]
+    
     def __repr__(self):
         return f"SymbolTable({self.symbols})"
 
@@ -150,14 +177,107 @@ class SemanticAnalyzer:
     # Opérateurs arithmétiques
     ARITHMETIC_OPS = {'+', '-', '*', '/'}
     
-    # Opérateurs de comparaison
-    COMPARISON_OPS = {'=', '≠', '<', '<=', '>', '>='}
+    # Opérateurs de comparaison. Le lexer internalise ≠, <= et >= (les
+    # autres opérateurs, d'un caractère latin ou en forme de nom, le sont
+    # déjà): internalisés ici aussi, ce sont les mêmes objets que dans
+    # l'AST et les recherches dans les tables réussissent par identité
+    COMPARISON_OPS = set(map(sys.intern, ('=', '≠', '<', '<=', '>', '>=')))
     
     # Opérateurs logiques
     LOGICAL_OPS = {'ET', 'OU'}
     
-    def __init__(self):
-        """Initialise l'analyseur avec une table des symboles vide."""
+    # Opérateurs d'égalité (seuls admis entre chaînes ou entre booléens)
+    EQUALITY_OPS = frozenset(map(sys.intern, ('=', '≠')))
+    
+    # Types numériques. Les noms de types viennent tous des littéraux du
+    # lexer et de ce module (chaînes internalisées): == et in réussissent
+    # par identité, sans comparer les caractères
+    NUMERIC_TYPES = frozenset(('ENTIER', 'REEL'))
+    
+    # Types des valeurs du langage
+    VALUE_TYPES = ('ENTIER', 'REEL', 'CHAINE', 'BOOLEEN')
+    
+    # (opérateur, type gauche, type droite) → type du résultat, construite à
+    # la première instanciation et partagée par tous les analyseurs
+    _binary_result_types = None
+    
+    def __init__(self, strict=True):
+        """
+        Initialise l'analyseur avec une table des symboles vide.
+        
+        Args:
+            strict: True (défaut) pour lever SemanticError à la première
+                    erreur; False pour le mode collecte, où les erreurs
+                    sont ajoutées à self.errors et l'analyse continue
+        """
+        self.reset()
+        self.strict = True  # Le temps de construire les tables (voir plus bas)
+        
+        # Tables de dispatch: type d'expression → méthode qui la vérifie et
+        # retourne son type (un seul parcours par expression) ...
+        self._check_dispatch = {
+            NumberNode: self._check_number,
+            StringNode: self._check_string,
+            BooleanNode: self._check_boolean,
+            VariableNode: self._check_variable,
+            BinaryOpNode: self._check_binary_op,
+            UnaryOpNode: self._check_unary_op,
+            FunctionCallNode: self._check_function_call,
+            ArrayAccessNode: self._check_array_access,
+        }
+        # ... opérateur binaire → vérification des types de sa catégorie ...
+        self._operator_checks = {
+            **dict.fromkeys(self.ARITHMETIC_OPS, self._check_arithmetic_types),
+            **dict.fromkeys(self.COMPARISON_OPS, self._check_comparison_types),
+            **dict.fromkeys(self.LOGICAL_OPS, self._check_logical_types),
+        }
+        # ... (opérateur, type gauche, type droite) → type du résultat, pour
+        # toutes les combinaisons valides. La table est déduite des
+        # vérifications elles-mêmes, une seule fois par classe; une
+        # combinaison absente (invalide) est repassée à sa vérification, qui
+        # lève l'erreur détaillée
+        if SemanticAnalyzer._binary_result_types is None:
+            result_types = {}
+            for op, check_types in self._operator_checks.items():
+                for left_type in self.VALUE_TYPES:
+                    for right_type in self.VALUE_TYPES:
+                        try:
+                            result_type = check_types(left_type, right_type, op, 0)
+                        except SemanticError:
+                            continue
+                        result_types[op, left_type, right_type] = result_type
+            SemanticAnalyzer._binary_result_types = result_types
+        # Les combinaisons invalides ne sont reconnues que si les vérifications
+        # lèvent leur erreur: la table est construite en mode strict
+        self.strict = strict
+        # ... et type de noeud → méthode d'analyse (les expressions, comme un
+        # appel de fonction en instruction, sont vérifiées et leur type ignoré)
+        self._analyze_dispatch = {
+            **self._check_dispatch,
+            ProgramNode: self._analyze_program,
+            DeclarationNode: self._analyze_declaration,
+            AssignmentNode: self._analyze_assignment,
+            PrintNode: self._analyze_print,
+            ReadNode: self._analyze_read,
+            IfNode: self._analyze_if,
+            WhileNode: self._analyze_while,
+            ForNode: self._analyze_for,
+            FunctionDefNode: self._analyze_function_def,
+            ReturnNode: self._analyze_return,
+            ArrayDeclarationNode: self._analyze_array_declaration,
+            ArrayAssignmentNode: self._analyze_array_assignment,
+        }
+        
+        # Mode collecte: chaque instruction est analysée sous reprise d'erreur
+        if not strict:
+            self.analyze = self._analyze_collecting
+    
+    def reset(self):
+        """
+        Vide la table des symboles, la table des fonctions et les erreurs,
+        pour analyser un autre programme avec le même analyseur (les tables
+        de dispatch et de types, construites une fois, sont conservées).
+        """
         self.symbol_table = SymbolTable()
         self.function_table = {}  # {nom: {'params': [...], 'return_type': type}}
         self.errors = []  # Liste des erreurs (mode collecte)
@@ -173,72 +293,59 @@ class SemanticAnalyzer:
         Raises:
             SemanticError: Si une erreur sémantique est détectée
         """
-        if isinstance(node, ProgramNode):
-            self._analyze_program(node)
-        
-        elif isinstance(node, DeclarationNode):
-            self._analyze_declaration(node)
-        
-        elif isinstance(node, AssignmentNode):
-            self._analyze_assignment(node)
-        
-        elif isinstance(node, NumberNode):
-            pass  # Les nombres sont toujours valides
-        
-        elif isinstance(node, StringNode):
-            pass  # Les chaînes sont toujours valides
-        
-        elif isinstance(node, BooleanNode):
-            pass  # Les booléens sont toujours valides
-        
-        elif isinstance(node, VariableNode):
-            self._analyze_variable(node)
-        
-        elif isinstance(node, BinaryOpNode):
-            self._analyze_binary_op(node)
-        
-        elif isinstance(node, UnaryOpNode):
-            self._analyze_unary_op(node)
-        
-        elif isinstance(node, PrintNode):
-            self._analyze_print(node)
-        
-        elif isinstance(node, ReadNode):
-            self._analyze_read(node)
-        
-        elif isinstance(node, IfNode):
-            self._analyze_if(node)
-        
-        elif isinstance(node, WhileNode):
-            self._analyze_while(node)
-        
-        elif isinstance(node, ForNode):
-            self._analyze_for(node)
-        
-        elif isinstance(node, FunctionDefNode):
-            self._analyze_function_def(node)
-        
-        elif isinstance(node, FunctionCallNode):
-            self._analyze_function_call(node)
-        
-        elif isinstance(node, ReturnNode):
-            self._analyze_return(node)
-        
-        elif isinstance(node, ArrayDeclarationNode):
-            self._analyze_array_declaration(node)
-        
-        elif isinstance(node, ArrayAccessNode):
-            self._analyze_array_access(node)
-        
-        elif isinstance(node, ArrayAssignmentNode):
-            self._analyze_array_assignment(node)
+        handler = self._analyze_dispatch.get(type(node))
+        if handler is None:
+            raise SemanticError(f"Type de noeud inconnu: {type(node)}")
+        handler(node)
+    
+    def _report(self, error):
+        """Lève l'erreur (mode strict) ou l'ajoute à self.errors (mode collecte)."""
+        if self.strict:
+            raise error
+        self.errors.append(error)
+    
+    def _error(self, message, line=None):
+        """
+        Signale une erreur après laquelle l'analyse peut continuer (le type
+        du résultat reste connu): levée en mode strict, collectée sinon.
+        """
+        self._report(SemanticError(message, line))
+    
+    def _analyze_collecting(self, node):
+        """
+        analyze en mode collecte (remplace self.analyze si strict=False):
+        une erreur qui interrompt l'analyse d'une instruction ou d'une
+        déclaration est enregistrée et l'analyse reprend à la suivante.
+        """
+        try:
+            SemanticAnalyzer.analyze(self, node)
+        except SemanticError as e:
+            self.errors.append(e)
+    
+    def check_expression(self, node):
+        """
+        Vérifie une expression et retourne son type, en un seul parcours.
         
-        else:
+        Args:
+            node: Le noeud AST de l'expression
+            
+        Returns:
+            Le type de l'expression: 'ENTIER', 'REEL', 'CHAINE', 'BOOLEEN'
+            (None pour l'appel d'une procédure)
+            
+        Raises:
+            SemanticError: Si l'expression ou l'une de ses sous-expressions
+                           est invalide
+        """
+        handler = self._check_dispatch.get(type(node))
+        if handler is None:
             raise SemanticError(f"Type de noeud inconnu: {type(node)}")
+        return handler(node)
     
     def infer_type(self, node):
         """
-        Infère le type d'une expression.
+        Infère le type d'une expression (voir check_expression, qui la
+        vérifie au passage).
         
         Args:
             node: Le noeud AST de l'expression
@@ -249,53 +356,104 @@ class SemanticAnalyzer:
         Raises:
             SemanticError: Si le type ne peut pas être inféré ou si incompatibilité
         """
-        # Littéraux
-        if isinstance(node, NumberNode):
-            # Déterminer si c'est un entier ou un réel
-            if isinstance(node.value, float):
-                return 'REEL'
-            return 'ENTIER'
+        return self.check_expression(node)
+    
+    def _check_number(self, node):
+        """Type d'un nombre: REEL pour un flottant, ENTIER sinon."""
+        if type(node.value) is float:
+            return 'REEL'
+        return 'ENTIER'
+    
+    def _check_string(self, node):
+        """Type d'une chaîne littérale."""
+        return 'CHAINE'
+    
+    def _check_boolean(self, node):
+        """Type d'un booléen littéral."""
+        return 'BOOLEEN'
+    
+    def _check_variable(self, node):
+        """Vérifie une référence à une variable et retourne son type."""
+        symbol = self.symbol_table.lookup(node.name, node.line)
         
-        if isinstance(node, StringNode):
-            return 'CHAINE'
+        # Erreur si on utilise un tableau sans indice
+        if symbol['is_array']:
+            raise SemanticError(
+                f"Tableau '{node.name}' doit être utilisé avec un indice",
+                node.line
+            )
         
-        if isinstance(node, BooleanNode):
-            return 'BOOLEEN'
+        return symbol['type']
+    
+    def _check_function_call(self, node):
+        """Vérifie un appel de fonction et retourne son type de retour."""
+        # Vérifier que la fonction existe
+        if node.name not in self.function_table:
+            raise SemanticError(
+                f"Fonction '{node.name}' non définie",
+                node.line
+            )
         
-        # Variable
-        if isinstance(node, VariableNode):
-            symbol = self.symbol_table.lookup(node.name, node.line)
-            return symbol['type']
+        # Vérifier le nombre d'arguments
+        func_info = self.function_table[node.name]
+        expected_params = len(func_info['params'])
+        actual_args = len(node.arguments)
         
-        # Opération binaire
-        if isinstance(node, BinaryOpNode):
-            return self._infer_binary_op_type(node)
+        if expected_params != actual_args:
+            self._error(
+                f"Fonction '{node.name}' attend {expected_params} argument(s), "
+                f"mais {actual_args} fourni(s)",
+                node.line
+            )
+            return func_info['return_type']
         
-        # Opération unaire
-        if isinstance(node, UnaryOpNode):
-            return self._infer_unary_op_type(node)
+        # Vérifier les types des arguments
+        for i, (arg, (param_name, param_type)) in enumerate(zip(node.arguments, func_info['params'])):
+            arg_type = self.check_expression(arg)
+            if not self._is_assignable(param_type, arg_type):
+                self._error(
+                    f"Argument {i+1} de la fonction '{node.name}': "
+                    f"attendu {param_type}, mais {arg_type} fourni",
+                    node.line
+                )
+        
+        return func_info['return_type']
+    
+    def _check_array_access(self, node):
+        """Vérifie un accès à un élément de tableau et retourne le type des éléments."""
+        return self._check_array_indexed(node.array_name, node.index, node.line)
+    
+    def _check_array_indexed(self, array_name, index, line):
+        """
+        Vérifie tab[indice], en lecture comme en affectation: le tableau
+        existe, c'est bien un tableau et l'indice est de type ENTIER.
+        
+        Returns:
+            Le type des éléments du tableau
+        """
+        # Vérifier que le tableau existe
+        arr_info = self.symbol_table.lookup(array_name, line)
         
-        # Appel de fonction
-        if isinstance(node, FunctionCallNode):
-            if node.name in self.function_table:
-                return self.function_table[node.name]['return_type']
+        # Vérifier que c'est bien un tableau
+        if not arr_info['is_array']:
             raise SemanticError(
-                f"Fonction '{node.name}' non définie",
-                node.line
+                f"Variable '{array_name}' n'est pas un tableau",
+                line
             )
         
-        # Accès à un élément de tableau
-        if isinstance(node, ArrayAccessNode):
-            return self.symbol_table.get_type(node.array_name)
+        # Vérifier le type de l'indice
+        index_type = self.check_expression(index)
+        if index_type != 'ENTIER':
+            self._error(
+                f"L'indice du tableau doit être de type ENTIER, mais {index_type} trouvé",
+                line
+            )
         
-        raise SemanticError(
-            f"Impossible d'inférer le type de l'expression: {type(node).__name__}",
-            getattr(node, 'line', None)
-        )
+        return arr_info['type']
     
-    def _infer_binary_op_type(self, node):
+    def _check_binary_op(self, node):
         """
-        Infère le type d'une opération binaire.
+        Vérifie une opération binaire et ses opérandes, et retourne son type.
         
         Règles:
         - Arithmétique (+, -, *, /):
@@ -312,25 +470,53 @@ class SemanticAnalyzer:
         
         - Logique (ET, OU):
           * BOOLEEN op BOOLEEN → BOOLEEN
-        """
-        left_type = self.infer_type(node.left)
-        right_type = self.infer_type(node.right)
-        op = node.operator
-        line = node.line
-        
-        # Opérateurs arithmétiques
-        if op in self.ARITHMETIC_OPS:
-            return self._check_arithmetic_types(left_type, right_type, op, line)
         
-        # Opérateurs de comparaison
-        if op in self.COMPARISON_OPS:
-            return self._check_comparison_types(left_type, right_type, op, line)
-        
-        # Opérateurs logiques
-        if op in self.LOGICAL_OPS:
-            return self._check_logical_types(left_type, right_type, op, line)
-        
-        raise SemanticError(f"Opérateur inconnu: '{op}'", line)
+        Les opérateurs étant associatifs à gauche, a + b + c + ... forme une
+        longue branche gauche d'opérations: elle est parcourue en boucle
+        (ordre postfixe: opérande le plus à gauche, puis pour chaque
+        opération en remontant, son opérande droit puis son opérateur).
+        Seuls les opérandes droits sont vérifiés par récursion.
+        """
+        left = node.left
+        if type(left) is not BinaryOpNode:
+            # Cas courant (x + 1, i ≤ n): pas de chaîne à parcourir
+            left_type = self.check_expression(left)
+            right_type = self.check_expression(node.right)
+            op = node.operator
+            result_type = self._binary_result_types.get(
+                (op, left_type, right_type)
+            )
+            if result_type is not None:
+                return result_type
+            check_types = self._operator_checks.get(op)
+            if check_types is None:
+                raise SemanticError(f"Opérateur inconnu: '{op}'", node.line)
+            return check_types(left_type, right_type, op, node.line)
+        
+        spine = []
+        while type(node) is BinaryOpNode:
+            spine.append(node)
+            node = node.left
+        result_type = self.check_expression(node)
+        
+        binary_result_types = self._binary_result_types
+        for node in reversed(spine):
+            right_type = self.check_expression(node.right)
+            op = node.operator
+            
+            # Combinaison valide: le type du résultat est lu dans la table.
+            # Sinon, vérification selon la catégorie de l'opérateur
+            # (arithmétique, comparaison ou logique), qui lève l'erreur
+            left_type = result_type
+            result_type = binary_result_types.get((op, left_type, right_type))
+            if result_type is None:
+                line = node.line
+                check_types = self._operator_checks.get(op)
+                if check_types is None:
+                    raise SemanticError(f"Opérateur inconnu: '{op}'", line)
+                result_type = check_types(left_type, right_type, op, line)
+        
+        return result_type
     
     def _check_arithmetic_types(self, left_type, right_type, op, line):
         """Vérifie les types pour les opérations arithmétiques."""
@@ -340,7 +526,7 @@ class SemanticAnalyzer:
             return 'CHAINE'
         
         # Types numériques uniquement pour l'arithmétique
-        numeric_types = {'ENTIER', 'REEL'}
+        numeric_types = self.NUMERIC_TYPES
         
         if left_type not in numeric_types:
             raise SemanticError(
@@ -370,8 +556,8 @@ class SemanticAnalyzer:
     def _check_comparison_types(self, left_type, right_type, op, line):
         """Vérifie les types pour les opérations de comparaison."""
         
-        numeric_types = {'ENTIER', 'REEL'}
-        equality_ops = {'=', '≠'}
+        numeric_types = self.NUMERIC_TYPES
+        equality_ops = self.EQUALITY_OPS
         
         # Comparaisons numériques (tous les opérateurs)
         if left_type in numeric_types and right_type in numeric_types:
@@ -381,40 +567,43 @@ class SemanticAnalyzer:
         if left_type == 'CHAINE' and right_type == 'CHAINE':
             if op in equality_ops:
                 return 'BOOLEEN'
-            raise SemanticError(
+            self._error(
                 f"Opérateur '{op}' invalide pour les chaînes "
                 f"(seuls = et ≠ sont autorisés)",
                 line
             )
+            return 'BOOLEEN'
         
         # Comparaisons de booléens (= et ≠ seulement)
         if left_type == 'BOOLEEN' and right_type == 'BOOLEEN':
             if op in equality_ops:
                 return 'BOOLEEN'
-            raise SemanticError(
+            self._error(
                 f"Opérateur '{op}' invalide pour les booléens "
                 f"(seuls = et ≠ sont autorisés)",
                 line
             )
+            return 'BOOLEEN'
         
-        # Types incompatibles
-        raise SemanticError(
+        # Types incompatibles (une comparaison reste BOOLEEN)
+        self._error(
             f"Comparaison '{op}' invalide entre {left_type} et {right_type}",
             line
         )
+        return 'BOOLEEN'
     
     def _check_logical_types(self, left_type, right_type, op, line):
         """Vérifie les types pour les opérations logiques."""
         
         if left_type != 'BOOLEEN':
-            raise SemanticError(
+            self._error(
                 f"Opérateur '{op}' requiert un opérande gauche de type BOOLEEN, "
                 f"mais {left_type} trouvé",
                 line
             )
         
         if right_type != 'BOOLEEN':
-            raise SemanticError(
+            self._error(
                 f"Opérateur '{op}' requiert un opérande droite de type BOOLEEN, "
                 f"mais {right_type} trouvé",
                 line
@@ -422,21 +611,21 @@ class SemanticAnalyzer:
         
         return 'BOOLEEN'
     
-    def _infer_unary_op_type(self, node):
+    def _check_unary_op(self, node):
         """
-        Infère le type d'une opération unaire.
+        Vérifie une opération unaire et son opérande, et retourne son type.
         
         Règles:
         - NON: opérande doit être BOOLEEN, retourne BOOLEEN
         - -: opérande doit être numérique, retourne le même type
         """
-        operand_type = self.infer_type(node.operand)
+        operand_type = self.check_expression(node.operand)
         op = node.operator
         line = node.line
         
         if op == 'NON':
             if operand_type != 'BOOLEEN':
-                raise SemanticError(
+                self._error(
                     f"Opérateur 'NON' requiert un opérande de type BOOLEEN, "
                     f"mais {operand_type} trouvé",
                     line
@@ -444,7 +633,7 @@ class SemanticAnalyzer:
             return 'BOOLEEN'
         
         if op == '-':
-            if operand_type not in {'ENTIER', 'REEL'}:
+            if operand_type not in self.NUMERIC_TYPES:
                 raise SemanticError(
                     f"Opérateur '-' unaire requiert un opérande numérique, "
                     f"mais {operand_type} trouvé",
@@ -461,9 +650,12 @@ class SemanticAnalyzer:
             self.analyze(decl)
         
         # Ensuite, enregistrer les fonctions dans la table des fonctions
+        # (en mode collecte, une redéfinition est signalée et la première
+        # définition est conservée)
         for func in node.functions:
             if func.name in self.function_table:
-                raise SemanticError(f"Fonction '{func.name}' déjà définie", func.line)
+                self._error(f"Fonction '{func.name}' déjà définie", func.line)
+                continue
             self.function_table[func.name] = {
                 'params': func.parameters,
                 'return_type': func.return_type,
@@ -487,27 +679,6 @@ class SemanticAnalyzer:
         self.symbol_table.declare(node.variable, node.element_type, node.line,
                                    is_array=True, array_size=node.size)
     
-    def _analyze_array_access(self, node):
-        """Analyse un accès à un élément de tableau."""
-        # Vérifier que le tableau existe
-        self.symbol_table.lookup(node.array_name, node.line)
-        
-        # Vérifier que c'est bien un tableau
-        if not self.symbol_table.is_array(node.array_name):
-            raise SemanticError(
-                f"Variable '{node.array_name}' n'est pas un tableau",
-                node.line
-            )
-        
-        # Analyser et vérifier le type de l'indice
-        self.analyze(node.index)
-        index_type = self.infer_type(node.index)
-        if index_type != 'ENTIER':
-            raise SemanticError(
-                f"L'indice du tableau doit être de type ENTIER, mais {index_type} trouvé",
-                node.line
-            )
-    
     def _analyze_array_assignment(self, node):
         """
         Analyse une affectation à un élément de tableau: tab[i] ← valeur
@@ -517,32 +688,15 @@ class SemanticAnalyzer:
         - Que l'indice est de type ENTIER
         - Que la valeur est compatible avec le type des éléments
         """
-        # Vérifier que le tableau existe
-        arr_info = self.symbol_table.lookup(node.array_name, node.line)
-        
-        # Vérifier que c'est bien un tableau
-        if not self.symbol_table.is_array(node.array_name):
-            raise SemanticError(
-                f"Variable '{node.array_name}' n'est pas un tableau",
-                node.line
-            )
-        
-        # Analyser et vérifier le type de l'indice
-        self.analyze(node.index)
-        index_type = self.infer_type(node.index)
-        if index_type != 'ENTIER':
-            raise SemanticError(
-                f"L'indice du tableau doit être de type ENTIER, mais {index_type} trouvé",
-                node.line
-            )
+        element_type = self._check_array_indexed(
+            node.array_name, node.index, node.line
+        )
         
-        # Analyser la valeur et vérifier la compatibilité de type
-        self.analyze(node.value)
-        value_type = self.infer_type(node.value)
-        element_type = arr_info['type']
+        # Vérifier la valeur et la compatibilité de type
+        value_type = self.check_expression(node.value)
         
         if not self._is_assignable(element_type, value_type):
-            raise SemanticError(
+            self._error(
                 f"Impossible d'affecter {value_type} à un élément du tableau "
                 f"'{node.array_name}' de type {element_type}",
                 node.line
@@ -559,9 +713,8 @@ class SemanticAnalyzer:
         - BOOLEEN ← BOOLEEN seulement
         """
         # Gérer l'accès à un élément de tableau comme cible
-        if isinstance(node.target, ArrayAccessNode):
-            self._analyze_array_access(node.target)
-            target_type = self.symbol_table.get_type(node.target.array_name)
+        if type(node.target) is ArrayAccessNode:
+            target_type = self._check_array_access(node.target)
             target_name = node.target.array_name
         else:
             # Variable simple
@@ -570,19 +723,18 @@ class SemanticAnalyzer:
             target_name = node.target
             
             # Erreur si on essaie d'affecter à un tableau sans indice
-            if self.symbol_table.is_array(node.target):
+            if target_info['is_array']:
                 raise SemanticError(
                     f"Tableau '{node.target}' doit être utilisé avec un indice",
                     node.line
                 )
         
-        # Analyser l'expression de valeur et inférer son type
-        self.analyze(node.value)
-        value_type = self.infer_type(node.value)
+        # Vérifier l'expression de valeur et obtenir son type
+        value_type = self.check_expression(node.value)
         
         # Vérifier la compatibilité des types
         if not self._is_assignable(target_type, value_type):
-            raise SemanticError(
+            self._error(
                 f"Impossible d'affecter {value_type} à '{target_name}' "
                 f"de type {target_type}",
                 node.line
@@ -610,30 +762,6 @@ class SemanticAnalyzer:
         # Toute autre combinaison: erreur
         return False
     
-    def _analyze_variable(self, node):
-        """Analyse une référence à une variable."""
-        self.symbol_table.lookup(node.name, node.line)
-        
-        # Erreur si on utilise un tableau sans indice
-        if self.symbol_table.is_array(node.name):
-            raise SemanticError(
-                f"Tableau '{node.name}' doit être utilisé avec un indice",
-                node.line
-            )
-    
-    def _analyze_binary_op(self, node):
-        """Analyse une opération binaire avec vérification des types."""
-        self.analyze(node.left)
-        self.analyze(node.right)
-        # La vérification des types est faite par infer_type
-        self.infer_type(node)
-    
-    def _analyze_unary_op(self, node):
-        """Analyse une opération unaire avec vérification des types."""
-        self.analyze(node.operand)
-        # La vérification des types est faite par infer_type
-        self.infer_type(node)
-    
     def _analyze_print(self, node):
         """
         Analyse une instruction ECRIRE.
@@ -641,9 +769,7 @@ class SemanticAnalyzer:
         Tous les types sont acceptés (printables).
         """
         for expr in node.expressions:
-            self.analyze(expr)
-            # Inférer le type pour vérifier que l'expression est valide
-            self.infer_type(expr)
+            self.check_expression(expr)
     
     def _analyze_read(self, node):
         """
@@ -663,13 +789,10 @@ class SemanticAnalyzer:
         
         La condition doit être de type BOOLEEN.
         """
-        # Analyser la condition
-        self.analyze(node.condition)
-        
-        # Vérifier que la condition est booléenne
-        condition_type = self.infer_type(node.condition)
+        # Vérifier la condition, qui doit être booléenne
+        condition_type = self.check_expression(node.condition)
         if condition_type != 'BOOLEEN':
-            raise SemanticError(
+            self._error(
                 f"La condition du SI doit être de type BOOLEEN, "
                 f"mais {condition_type} trouvé",
                 node.line
@@ -690,13 +813,10 @@ class SemanticAnalyzer:
         
         La condition doit être de type BOOLEEN.
         """
-        # Analyser la condition
-        self.analyze(node.condition)
-        
-        # Vérifier que la condition est booléenne
-        condition_type = self.infer_type(node.condition)
+        # Vérifier la condition, qui doit être booléenne
+        condition_type = self.check_expression(node.condition)
         if condition_type != 'BOOLEEN':
-            raise SemanticError(
+            self._error(
                 f"La condition du TANT_QUE doit être de type BOOLEEN, "
                 f"mais {condition_type} trouvé",
                 node.line
@@ -719,27 +839,25 @@ class SemanticAnalyzer:
         
         # Vérifier que la variable de boucle est de type ENTIER
         if var_info['type'] != 'ENTIER':
-            raise SemanticError(
+            self._error(
                 f"La variable de boucle POUR '{node.variable}' doit être de type ENTIER, "
                 f"mais {var_info['type']} trouvé",
                 node.line
             )
         
-        # Analyser et vérifier le type de l'expression de début
-        self.analyze(node.start)
-        start_type = self.infer_type(node.start)
+        # Vérifier le type de l'expression de début
+        start_type = self.check_expression(node.start)
         if start_type != 'ENTIER':
-            raise SemanticError(
+            self._error(
                 f"La valeur de début de la boucle POUR doit être de type ENTIER, "
                 f"mais {start_type} trouvé",
                 node.line
             )
         
-        # Analyser et vérifier le type de l'expression de fin
-        self.analyze(node.end)
-        end_type = self.infer_type(node.end)
+        # Vérifier le type de l'expression de fin
+        end_type = self.check_expression(node.end)
         if end_type != 'ENTIER':
-            raise SemanticError(
+            self._error(
                 f"La valeur de fin de la boucle POUR doit être de type ENTIER, "
                 f"mais {end_type} trouvé",
                 node.line
@@ -751,12 +869,15 @@ class SemanticAnalyzer:
     
     def _analyze_function_def(self, node):
         """Analyse une définition de fonction."""
-        # Sauvegarder la table des symboles actuelle
-        saved_symbols = self.symbol_table.symbols.copy()
+        # Entrer dans la portée de la fonction
+        self.symbol_table.push_scope()
         
         # Ajouter les paramètres à la table des symboles
         for param_name, param_type in node.parameters:
-            self.symbol_table.declare(param_name, param_type, node.line)
+            try:
+                self.symbol_table.declare(param_name, param_type, node.line)
+            except SemanticError as e:
+                self._report(e)
         
         # Traiter les déclarations locales
         for decl in node.declarations:
@@ -766,48 +887,14 @@ class SemanticAnalyzer:
         for stmt in node.body:
             self.analyze(stmt)
         
-        # Restaurer la table des symboles (sortie de portée)
-        self.symbol_table.symbols = saved_symbols
-    
-    def _analyze_function_call(self, node):
-        """Analyse un appel de fonction."""
-        # Vérifier que la fonction existe
-        if node.name not in self.function_table:
-            raise SemanticError(
-                f"Fonction '{node.name}' non définie",
-                node.line
-            )
-        
-        # Vérifier le nombre d'arguments
-        func_info = self.function_table[node.name]
-        expected_params = len(func_info['params'])
-        actual_args = len(node.arguments)
-        
-        if expected_params != actual_args:
-            raise SemanticError(
-                f"Fonction '{node.name}' attend {expected_params} argument(s), "
-                f"mais {actual_args} fourni(s)",
-                node.line
-            )
-        
-        # Analyser et vérifier les types des arguments
-        for i, (arg, (param_name, param_type)) in enumerate(zip(node.arguments, func_info['params'])):
-            self.analyze(arg)
-            arg_type = self.infer_type(arg)
-            if not self._is_assignable(param_type, arg_type):
-                raise SemanticError(
-                    f"Argument {i+1} de la fonction '{node.name}': "
-                    f"attendu {param_type}, mais {arg_type} fourni",
-                    node.line
-                )
+        # Sortie de portée: oublier paramètres et variables locales
+        self.symbol_table.pop_scope()
     
     def _analyze_return(self, node):
         """Analyse une instruction RETOURNER."""
-        # Si il y a une expression de retour, l'analyser
+        # Si il y a une expression de retour, la vérifier
         if node.value is not None:
-            self.analyze(node.value)
-            # Inférer le type pour vérifier que l'expression est valide
-            self.infer_type(node.value)
+            self.check_expression(node.value)
         # Si node.value est None, c'est un RETOURNER sans valeur (pour void)
 
 
@@ -816,15 +903,25 @@ class SemanticAnalyzer:
 # ============================================================
 
 if __name__ == '__main__':
-    import sys
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    # reconfigure() garde le mode de tampon du flux: une écriture par ligne
+    # sur une console (line_buffering), une seule pour toute la sortie dans
+    # un tube ou un fichier
+    sys.stdout.reconfigure(encoding='utf-8')
     
     from lexer import Lexer
     from parser import Parser
     
+    # Un analyseur par mode pour tous les tests, vidés par reset() avant
+    # chacun: le mode collecte range les erreurs dans analyzer.errors, le
+    # mode strict (celui de main.py) lève la première
+    strict_analyzer = SemanticAnalyzer()
+    analyzer = SemanticAnalyzer(strict=False)
+    
     def test_semantic(code, description, should_pass=True):
-        """Teste l'analyseur sémantique sur un code donné."""
+        """
+        Teste l'analyseur sémantique sur un code donné: en mode collecte, et
+        aussi en mode strict s'il doit passer.
+        """
         print(f"=== {description} ===")
         print(f"Attendu: {'SUCCÈS' if should_pass else 'ERREUR'}")
         print()
@@ -833,25 +930,34 @@ if __name__ == '__main__':
         tokens = lexer.tokenize()
         parser = Parser(tokens)
         ast = parser.parse()
-        analyzer = SemanticAnalyzer()
         
-        try:
-            analyzer.analyze(ast)
+        # Un programme correct passe aussi en mode strict, hors de tout try:
+        # une erreur inattendue y remonte telle quelle
+        if should_pass:
+            strict_analyzer.reset()
+            strict_analyzer.analyze(ast)
+        
+        analyzer.reset()
+        analyzer.analyze(ast)
+        error = analyzer.errors[0] if analyzer.errors else None
+        
+        if error is None:
             if should_pass:
                 print(f"✓ Aucune erreur sémantique (comme attendu)")
             else:
                 print(f"✗ ERREUR: Aucune erreur détectée alors qu'une erreur était attendue!")
-        except SemanticError as e:
-            if should_pass:
-                print(f"✗ ERREUR: {e}")
-            else:
-                print(f"✓ Erreur détectée (comme attendu): {e}")
+        elif should_pass:
+            print(f"✗ ERREUR: {error}")
+        else:
+            print(f"✓ Erreur détectée (comme attendu): {error}")
         print()
     
-    # ========== Tests qui doivent PASSER ==========
-    
-    # Test 1: Types numériques compatibles
-    test_semantic("""ALGORITHME TestNumerique
+    # Programmes de test: (code, description, succès attendu)
+    TESTS = (
+        # ========== Tests qui doivent PASSER ==========
+        
+        # Test 1: Types numériques compatibles
+        ("""ALGORITHME TestNumerique
 VAR x : ENTIER
 VAR y : REEL
 VAR z : REEL
@@ -862,10 +968,10 @@ DEBUT
     z ← x * 2
     y ← x / 2
 FIN
-""", "Test 1: Arithmétique numérique mixte", should_pass=True)
-    
-    # Test 2: Concaténation de chaînes
-    test_semantic("""ALGORITHME TestChaines
+""", "Test 1: Arithmétique numérique mixte", True),
+        
+        # Test 2: Concaténation de chaînes
+        ("""ALGORITHME TestChaines
 VAR nom : CHAINE
 VAR message : CHAINE
 DEBUT
@@ -873,10 +979,10 @@ DEBUT
     message ← "Bonjour " + nom
     ECRIRE(message)
 FIN
-""", "Test 2: Concaténation de chaînes", should_pass=True)
-    
-    # Test 3: Conditions booléennes
-    test_semantic("""ALGORITHME TestBooleen
+""", "Test 2: Concaténation de chaînes", True),
+        
+        # Test 3: Conditions booléennes
+        ("""ALGORITHME TestBooleen
 VAR x : ENTIER
 VAR y : ENTIER
 VAR ok : BOOLEEN
@@ -891,30 +997,30 @@ DEBUT
         x ← x + 1
     FIN_TANT_QUE
 FIN
-""", "Test 3: Conditions booléennes", should_pass=True)
-    
-    # ========== Tests qui doivent ÉCHOUER ==========
-    
-    # Test 4: Affectation de type incompatible
-    test_semantic("""ALGORITHME TestErreurAffectation
+""", "Test 3: Conditions booléennes", True),
+        
+        # ========== Tests qui doivent ÉCHOUER ==========
+        
+        # Test 4: Affectation de type incompatible
+        ("""ALGORITHME TestErreurAffectation
 VAR x : ENTIER
 DEBUT
     x ← "texte"
 FIN
-""", "Test 4: Affectation CHAINE à ENTIER", should_pass=False)
-    
-    # Test 5: Arithmétique avec CHAINE
-    test_semantic("""ALGORITHME TestErreurArith
+""", "Test 4: Affectation CHAINE à ENTIER", False),
+        
+        # Test 5: Arithmétique avec CHAINE
+        ("""ALGORITHME TestErreurArith
 VAR x : ENTIER
 VAR msg : CHAINE
 DEBUT
     msg ← "hello"
     x ← x + msg
 FIN
-""", "Test 5: Arithmétique ENTIER + CHAINE", should_pass=False)
-    
-    # Test 6: Condition non booléenne
-    test_semantic("""ALGORITHME TestErreurCondition
+""", "Test 5: Arithmétique ENTIER + CHAINE", False),
+        
+        # Test 6: Condition non booléenne
+        ("""ALGORITHME TestErreurCondition
 VAR x : ENTIER
 DEBUT
     x ← 10
@@ -922,10 +1028,10 @@ DEBUT
         ECRIRE("erreur")
     FIN_SI
 FIN
-""", "Test 6: ENTIER utilisé comme condition", should_pass=False)
-    
-    # Test 7: ET avec non-booléens
-    test_semantic("""ALGORITHME TestErreurLogique
+""", "Test 6: ENTIER utilisé comme condition", False),
+        
+        # Test 7: ET avec non-booléens
+        ("""ALGORITHME TestErreurLogique
 VAR x : ENTIER
 VAR msg : CHAINE
 DEBUT
@@ -935,20 +1041,20 @@ DEBUT
         ECRIRE("erreur")
     FIN_SI
 FIN
-""", "Test 7: ET avec ENTIER et CHAINE", should_pass=False)
-    
-    # Test 8: Boucle POUR avec variable non-ENTIER
-    test_semantic("""ALGORITHME TestErreurPour
+""", "Test 7: ET avec ENTIER et CHAINE", False),
+        
+        # Test 8: Boucle POUR avec variable non-ENTIER
+        ("""ALGORITHME TestErreurPour
 VAR i : REEL
 DEBUT
     POUR i DE 1 A 10 FAIRE
         ECRIRE(i)
     FIN_POUR
 FIN
-""", "Test 8: Boucle POUR avec REEL", should_pass=False)
-    
-    # Test 9: Comparaison incompatible
-    test_semantic("""ALGORITHME TestErreurComp
+""", "Test 8: Boucle POUR avec REEL", False),
+        
+        # Test 9: Comparaison incompatible
+        ("""ALGORITHME TestErreurComp
 VAR x : ENTIER
 VAR msg : CHAINE
 DEBUT
@@ -958,9 +1064,71 @@ DEBUT
         ECRIRE("erreur")
     FIN_SI
 FIN
-""", "Test 9: Comparaison ENTIER = CHAINE", should_pass=False)
+""", "Test 9: Comparaison ENTIER = CHAINE", False),
+    )
     
-    print("✓ Tous les tests de l'analyseur sémantique terminés!")
-
+    # Numéros des tests à lancer (python semantic.py 5 9); tous par défaut.
+    # Les tests de TESTS sont suivis des tests 10 et 11
+    test_count = len(TESTS) + 2
+    try:
+        selected = {int(arg) for arg in sys.argv[1:]}
+    except ValueError:
+        selected = None
+    if selected is None or not all(1 <= n <= test_count for n in selected):
+        print(f"Usage: python semantic.py [numéros de tests, de 1 à {test_count}]")
+        sys.exit(1)
+    
+    for number, (code, description, should_pass) in enumerate(TESTS, 1):
+        if not selected or number in selected:
+            test_semantic(code, description, should_pass)
+    
+    # Test 10: Mode collecte (strict=False), toutes les erreurs signalées
+    if not selected or 10 in selected:
+        print("=== Test 10: Mode collecte de toutes les erreurs ===")
+        code = """ALGORITHME TestCollecte
+VAR x : ENTIER
+VAR msg : CHAINE
+DEBUT
+    x ← "texte"
+    SI x ALORS
+        msg ← msg + 1
+    FIN_SI
+    y ← 3
+FIN
+"""
+        analyzer.reset()
+        analyzer.analyze(Parser(Lexer(code).tokenize()).parse())
+        for error in analyzer.errors:
+            print(f"  {error}")
+        if len(analyzer.errors) == 4:
+            print("✓ 4 erreurs collectées (comme attendu)")
+        else:
+            print(f"✗ ERREUR: {len(analyzer.errors)} erreur(s) collectée(s), 4 attendues")
+        print()
+    
+    # Test 11: Mode strict, la première erreur collectée doit être levée
+    if not selected or 11 in selected:
+        print("=== Test 11: Mode strict, première erreur levée ===")
+        mismatches = 0
+        for number, (code, description, should_pass) in enumerate(TESTS, 1):
+            if should_pass:
+                continue
+            ast = Parser(Lexer(code).tokenize()).parse()
+            analyzer.reset()
+            analyzer.analyze(ast)
+            collected = analyzer.errors[0] if analyzer.errors else None
+            strict_analyzer.reset()
+            try:
+                strict_analyzer.analyze(ast)
+                error = None
+            except SemanticError as e:
+                error = e
+            if str(error) != str(collected):
+                mismatches += 1
+                print(f"✗ ERREUR: test {number}, mode strict ({error}) et "
+                      f"mode collecte ({collected}) en désaccord")
+        if not mismatches:
+            print("✓ Même première erreur dans les deux modes (tests 4 à 9)")
+        print()
     
     print("✓ Tous les tests de l'analyseur sémantique terminés!")